@@ -1,12 +1,71 @@
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import logging
 
 from multi_agent.config.models import MeetingSchedule, NegotiationResult, ParticipantPreferences, NegotiationOutcome, \
     SlotInfo, NegotiationStrategy
-from multi_agent.logger.AgentLogger import AgentLogger
+from multi_agent.logger.AgentLogger import AgentLogger, TRACE
+
+# Fixed windows in minutes since midnight (lunch) or hours (time-of-day preferences)
+LUNCH_START_MINUTE, LUNCH_END_MINUTE = 12 * 60, 13 * 60
+MORNING_HOURS = (6, 12)
+AFTERNOON_HOURS = (13, 18)
+
+# Strategy levels as plain ints, previous_strategy is compared against them once per strategy
+_DURATION_ADJUSTMENT = int(NegotiationStrategy.DURATION_ADJUSTMENT)
+_TOD_SHIFTING = int(NegotiationStrategy.TOD_SHIFTING)
+_ALTERNATIVE_DAY = int(NegotiationStrategy.ALTERNATIVE_DAY)
+_RELAX_CONSTRAINTS = int(NegotiationStrategy.RELAX_CONSTRAINTS)
+_NEVER = _RELAX_CONSTRAINTS + 1
+
+# Negotiation strategies in the order they are tried: (lo, hi, process step, name). A strategy is
+# skipped while lo <= previous strategy < hi, i.e. it already ran and no restart has been reached
+STRATEGIES = (
+    (_DURATION_ADJUSTMENT, _ALTERNATIVE_DAY, "strategy_duration", "duration adjustment"),
+    (_TOD_SHIFTING, _ALTERNATIVE_DAY, "strategy_tod", "time-of-day shifting"),
+    (_ALTERNATIVE_DAY, _NEVER, "strategy_alt_day", "alternative day"),
+    (_RELAX_CONSTRAINTS, _NEVER, "strategy_relax", "constraint relaxation"),
+)
+
+# Number of slots kept by a negotiation, the best one and two alternatives
+TOP_SLOTS = 3
+
+# Rows of the slot violation matrix built by NegotiationSpecialistAgent._violations
+(V_NO_BEFORE, V_NO_AFTER, V_LUNCH, V_MAX_DURATION,
+ V_MORNING, V_AFTERNOON, V_DAILY_CAP, V_SHORT_FOR_CAP) = range(8)
+VIOLATION_KINDS = 8
+HARD_VIOLATIONS = slice(V_NO_BEFORE, V_MAX_DURATION + 1)
+STRICT_VIOLATIONS = slice(V_NO_BEFORE, V_DAILY_CAP + 1)
+
+
+def _parse_slot_time(value: str) -> datetime:
+    """Parses a single slot timestamp ("YYYY-MM-DD HH:MM")."""
+    return datetime.fromisoformat(value)
+
+
+def _parse_slot_times(values: list[str]) -> np.ndarray:
+    """
+    Parses slot timestamps ("YYYY-MM-DD HH:MM") in bulk into a datetime64[m] array, pandas
+    parses the whole list in its C fast path instead of one datetime per slot.
+    """
+    return pd.to_datetime(values, format="ISO8601", cache=True).to_numpy().astype("datetime64[m]")
+
+
+def _hhmm_to_minutes(value: str) -> int:
+    """Minutes since midnight of a "HH:MM" (or "HH") time, compared as plain ints in the hot paths."""
+    hours, _, minutes = value.partition(":")
+
+    return int(hours) * 60 + int(minutes or 0)
+
+
+def _minutes_to_hhmm(value: int) -> str:
+    """Formats minutes since midnight as "HH:MM", wrapping around midnight."""
+    hours, minutes = divmod(value % (24 * 60), 60)
+
+    return f"{hours:02d}:{minutes:02d}"
 
 
 class NegotiationSpecialistAgent:
@@ -19,9 +78,9 @@ class NegotiationSpecialistAgent:
 
     def __init__(self, initial_schedule: MeetingSchedule, logger: Optional[AgentLogger] = None):
         self.initial = initial_schedule
-        self.logger = logger or AgentLogger(agent_name="NegotiationSpecialist")
+        self.logger = logger if logger is not None else AgentLogger.get_or_create("NegotiationSpecialist")
         self.logger.info("Initialized negotiation specialist agent")
-        self.logger.debug(f"Initial schedule: {initial_schedule}")
+        self.logger.debug("Initial schedule: %s", initial_schedule)
 
     def negotiate_schedule(
             self,
@@ -34,7 +93,7 @@ class NegotiationSpecialistAgent:
         self.logger.process_step("negotiate_schedule", "Starting negotiation process")
         self.logger.data_in("ScheduleAnalyst", f"Received {len(available_slots)} available slots")
         self.logger.data_in("Participants", f"Received preferences for {len(participants)} participants")
-        self.logger.debug(f"Min score: {min_score}, Previous strategy: {previous_strategy}")
+        self.logger.debug("Min score: %s, Previous strategy: %s", min_score, previous_strategy)
 
         # split inputs
         self.logger.process_step("preference_processing", "Processing participant preferences")
@@ -42,25 +101,35 @@ class NegotiationSpecialistAgent:
         prefs: dict[str, ParticipantPreferences] = {
             p: (d["preferences"]
                 if isinstance(d["preferences"], ParticipantPreferences)
-                else ParticipantPreferences(**d["preferences"]))
+                else ParticipantPreferences.model_validate(d["preferences"]))
             for p, d in participants.items()
         }
 
         calendars: dict[str, pd.DataFrame] = {p: d["calendar"] for p, d in participants.items()}
 
-        self.logger.debug(f"Processed preferences for participants: {list(prefs.keys())}")
+        # meetings per calendar day, computed once for the strict filter and the alternative day search
+        day_counts = self._daily_meeting_counts(prefs, calendars)
+
+        self.logger.debug("Processed preferences for participants: %s", list(prefs))
+
+        # Slots are ranked by confidence once (stable, ties keep their original order), so every
+        # filtered selection below is already ranked and its best slots are its first ones
+        available_slots = sorted(available_slots, key=lambda s: s.confidence, reverse=True)
 
         self.logger.process_step("strict_filter", "Filtering slots by strict preferences")
 
-        # Filter slots using preferences
-        ok_slots = [s for s in available_slots if self._slot_respects_all(s, prefs, calendars)]
+        # Every preference is checked once, the strict filter and the strategies select rows of the matrix
+        violations = self._violations(available_slots, prefs, day_counts)
+        hard_mask = ~violations[HARD_VIOLATIONS].any(axis=0)
+        strict_mask = ~violations[STRICT_VIOLATIONS].any(axis=0)
+        ok_slots = np.flatnonzero(strict_mask)
 
         self.logger.info(f"Found {len(ok_slots)} slots respecting all preferences")
 
         # already have acceptable slots?
-        if ok_slots:
-            ok_slots.sort(key=lambda s: s.confidence, reverse=True)
-            best = ok_slots[0] # Slot with best confidence
+        if len(ok_slots):
+            top = [available_slots[i] for i in ok_slots[:TOP_SLOTS]]
+            best = top[0] # Slot with best confidence
 
             outcome = NegotiationOutcome.OPTIMAL_FOUND if best.confidence >= min_score else NegotiationOutcome.COMPROMISE_PROPOSED
 
@@ -73,7 +142,7 @@ class NegotiationSpecialistAgent:
                 proposed_schedule=self.initial,
                 selected_slot=best,
                 reasoning="Found slot complying with every explicit preference.",
-                alternative_suggestions=ok_slots[1:3]
+                alternative_suggestions=top[1:]
             )
 
             self.logger.data_out("Coordinator",
@@ -84,72 +153,32 @@ class NegotiationSpecialistAgent:
 
         # No Good one, we need to compromise
         self.logger.process_step("iterative_negotiation", "No exact match found, starting iterative negotiation")
-        result: Optional[NegotiationResult] = None
+        prev = int(previous_strategy)
 
         # The strategies are ordered by magnitude of impact, so a stronger strategy continues after the last one, when ALTERNATIVE_DAY is reach all lesser strategies are tested again
+        strategies = (
+            lambda: self._strategy_duration_adjust(available_slots, prefs, ~violations[V_SHORT_FOR_CAP]),
+            lambda: self._strategy_time_shift(available_slots, hard_mask),
+            lambda: self._strategy_alternative_day(available_slots, prefs, day_counts),
+            lambda: self._strategy_relax_hours(available_slots, hard_mask),
+        )
 
-        # =======================================================================
-        # Duration Adjustment
-        # =======================================================================
-        if previous_strategy < NegotiationStrategy.DURATION_ADJUSTMENT or previous_strategy >= NegotiationStrategy.ALTERNATIVE_DAY:
-            self.logger.process_step("strategy_duration", "Trying duration adjustment strategy")
-            result = self._strategy_duration_adjust(available_slots, prefs)
-
-            if result:
-                self.logger.decision("strategy_selection", "Duration adjustment successful")
-                self.logger.data_out("Coordinator", f"Returning result with strategy {result.strategy_choose}")
-
-                return result
-
-            self.logger.info("Duration adjustment strategy failed to find a solution")
-
-        # =======================================================================
-        # Time-of-day Shifting
-        # =======================================================================
-        if previous_strategy < NegotiationStrategy.TOD_SHIFTING or previous_strategy >= NegotiationStrategy.ALTERNATIVE_DAY:
-            self.logger.process_step("strategy_tod", "Trying time-of-day shifting strategy")
-
-            result = self._strategy_time_shift(available_slots, prefs)
-
-            if result:
-                self.logger.decision("strategy_selection", "Time-of-day shifting successful")
-                self.logger.data_out("Coordinator", f"Returning result with strategy {result.strategy_choose}")
-
-                return result
-
-            self.logger.info("Time-of-day shifting strategy failed to find a solution")
-
-        # =======================================================================
-        # Alternative day
-        # =======================================================================
-        if previous_strategy < NegotiationStrategy.ALTERNATIVE_DAY:
-            self.logger.process_step("strategy_alt_day", "Trying alternative day strategy")
-
-            result = self._strategy_alternative_day(available_slots, prefs, calendars)
-
-            if result:
-                self.logger.decision("strategy_selection", "Alternative day strategy successful")
-                self.logger.data_out("Coordinator", f"Returning result with strategy {result.strategy_choose}")
-
-                return result
-
-            self.logger.info("Alternative day strategy failed to find a solution")
+        for (lo, hi, step, name), strategy in zip(STRATEGIES, strategies):
+            # a strategy runs when the previous one is weaker, or has reached `hi` and starts over
+            if lo <= prev < hi:
+                continue
 
-        # =======================================================================
-        # Relax constraints
-        # =======================================================================
-        if previous_strategy < NegotiationStrategy.RELAX_CONSTRAINTS:
-            self.logger.process_step("strategy_relax", "Trying constraint relaxation strategy")
+            self.logger.process_step(step, f"Trying {name} strategy")
 
-            result = self._strategy_relax_hours(available_slots, prefs)
+            result = strategy()
 
             if result:
-                self.logger.decision("strategy_selection", "Constraint relaxation successful")
+                self.logger.decision("strategy_selection", f"{name.capitalize()} strategy successful")
                 self.logger.data_out("Coordinator", f"Returning result with strategy {result.strategy_choose}")
 
                 return result
 
-            self.logger.info("Constraint relaxation strategy failed to find a solution")
+            self.logger.info(f"{name.capitalize()} strategy failed to find a solution")
 
         # if still None → impossible
         self.logger.decision("negotiation_outcome", "All strategies exhausted, no solution found")
@@ -166,99 +195,157 @@ class NegotiationSpecialistAgent:
 
         return result
 
-    def _slot_respects_all(
+    def _violations(
             self,
-            slot: SlotInfo,
+            slots: list[SlotInfo],
             prefs: dict[str, ParticipantPreferences],
-            calendars: dict[str, pd.DataFrame]
-    ) -> bool:
+            day_counts: dict[str, dict[date, int]]
+    ) -> np.ndarray:
         """
-        Checks if a given time slot respects all participant preferences and constraints.
-
-        This method evaluates a specified time slot against various preferences and
-        calendar constraints of all participants. These include time-window prohibitions,
-        preferred time of day (morning/afternoon), avoidance of lunch-time meetings, maximum
-        meeting duration, and daily meeting caps. If the time slot violates any of these
-        criteria for any participant, it is rejected.
-
-        :param slot: The SlotInfo object representing the time slot to evaluate.
+        Builds the violation matrix of the time slots, one row per preference check (see the
+        `V_*` constants) and one column per slot, True where the slot violates the check for
+        at least one participant.
+
+        Every check is evaluated once, in a single vectorized pass over the slot times (minutes
+        since midnight), and the strict filter and the strategies only select rows of the
+        matrix instead of filtering the slots again:
+          - hard preferences (`HARD_VIOLATIONS`): time-window prohibitions, lunch-time
+            avoidance and maximum meeting duration, never relaxed by the negotiation
+          - soft preferences: preferred time of day (morning/afternoon) and daily meeting caps,
+            together with the hard ones they make `STRICT_VIOLATIONS`
+          - `V_SHORT_FOR_CAP`: slot shorter than the smallest preferred max duration, only used
+            by the duration adjustment strategy
+
+        :param slots: The SlotInfo objects representing the time slots to evaluate.
         :param prefs: A dictionary where keys are participant IDs (str) and values are
             ParticipantPreferences objects defining constraints and preferences for each
             participant.
-        :param calendars: A dictionary where keys are participant IDs (str) and values
-            are pandas DataFrame objects representing their schedules, with start times
-            of meetings.
+        :param day_counts: A dictionary where keys are participant IDs (str) and values
+            are their number of meetings per calendar day, see `_daily_meeting_counts`.
 
-        :return: True if the slot respects all preferences and constraints; False otherwise.
-        :rtype: bool
+        :return: Boolean matrix of shape (number of checks, number of slots).
+        :rtype: np.ndarray
         """
-        st = datetime.strptime(slot.start_time, "%Y-%m-%d %H:%M")
-        et = datetime.strptime(slot.end_time, "%Y-%m-%d %H:%M")
-        dur = slot.duration_minutes
+        n = len(slots)
 
-        slot_desc = f"{slot.start_time}-{slot.end_time}"
-        self.logger.trace(f"Checking slot {slot_desc} against all preferences")
+        # Each kind of preference collapses into the strictest bound among the participants,
+        # so the matrix takes a fixed number of in-place passes whatever the number of participants
+        no_before = max((pr.no_before_min for pr in prefs.values() if pr.no_meetings_before), default=None)
+        no_after = min((pr.no_after_min for pr in prefs.values() if pr.no_meetings_after), default=None)
+        max_duration = min((pr.preferred_max_duration for pr in prefs.values() if pr.preferred_max_duration),
+                           default=None)
+        avoid_lunch = any(pr.avoid_lunch_time for pr in prefs.values())
+        prefer_morning = any(pr.prefer_morning for pr in prefs.values())
+        prefer_afternoon = any(pr.prefer_afternoon for pr in prefs.values())
 
-        # lunch interval (12-13)
-        lunch = (time(12, 0), time(13, 0))
+        self.logger.trace("Hard bounds: not before %s, not after %s, max duration %s, avoid lunch %s",
+                          no_before, no_after, max_duration, avoid_lunch)
 
-        for p, pr in prefs.items():
-            # time-window prohibitions
-            if pr.no_meetings_before and st.time() < pr.no_before():
-                self.logger.trace(
-                    f"Slot {slot_desc} rejected: before {p}'s no_meetings_before ({pr.no_meetings_before})")
+        violations = np.zeros((VIOLATION_KINDS, n), dtype=bool)
+        tmp = np.empty(n, dtype=bool)
+
+        # Only the slot fields read by an active preference are extracted, participants
+        # usually set a handful of them and the conversions dominate the cost of the checks
+        needs_start = no_before is not None or avoid_lunch or prefer_morning or prefer_afternoon
 
-                return False
+        if needs_start or day_counts:
+            starts = _parse_slot_times([s.start_time for s in slots])
+            start_day = starts.astype("datetime64[D]")
 
-            if pr.no_meetings_after and et.time() > pr.no_after():
-                self.logger.trace(f"Slot {slot_desc} rejected: after {p}'s no_meetings_after ({pr.no_meetings_after})")
+        if needs_start:
+            start_min = (starts - start_day).astype(np.int32)
 
-                return False
+        if no_after is not None or avoid_lunch:
+            ends = _parse_slot_times([s.end_time for s in slots])
+            end_min = (ends - ends.astype("datetime64[D]")).astype(np.int32)
 
-            # morning / afternoon preference
-            if pr.prefer_morning and not (6 <= st.hour < 12):
-                self.logger.trace(f"Slot {slot_desc} rejected: not morning for {p} who prefers morning")
+        # time-window prohibitions
+        if no_before is not None:
+            np.less(start_min, no_before, out=violations[V_NO_BEFORE])
 
-                return False
+        if no_after is not None:
+            np.greater(end_min, no_after, out=violations[V_NO_AFTER])
 
-            if pr.prefer_afternoon and not (13 <= st.hour < 18):
-                self.logger.trace(f"Slot {slot_desc} rejected: not afternoon for {p} who prefers afternoon")
+        # avoid lunch (12-13), starting in [12:00, 13:00) or ending in (12:00, 13:00]
+        if avoid_lunch:
+            row = violations[V_LUNCH]
 
-                return False
+            np.greater_equal(start_min, LUNCH_START_MINUTE, out=row)
+            np.less(start_min, LUNCH_END_MINUTE, out=tmp)
+            row &= tmp
 
-            # avoid lunch
-            if pr.avoid_lunch_time and (lunch[0] <= st.time() < lunch[1] or lunch[0] < et.time() <= lunch[1]):
-                self.logger.trace(f"Slot {slot_desc} rejected: overlaps lunch time for {p}")
+            np.greater(end_min, LUNCH_START_MINUTE, out=tmp)
+            row |= tmp & (end_min <= LUNCH_END_MINUTE)
 
-                return False
+        # max duration, the same bound tells which slots can be shortened to it
+        if max_duration is not None:
+            duration = np.fromiter((s.duration_minutes for s in slots), dtype=np.int32, count=n)
 
-            # max duration
-            if pr.preferred_max_duration and dur > pr.preferred_max_duration:
-                self.logger.trace(f"Slot {slot_desc} rejected: duration {dur} exceeds {p}'s max {pr.preferred_max_duration}")
+            np.greater(duration, max_duration, out=violations[V_MAX_DURATION])
+            np.less(duration, max_duration, out=violations[V_SHORT_FOR_CAP])
 
-                return False
+        # morning / afternoon preference, applied once whoever of the participants holds it
+        if prefer_morning or prefer_afternoon:
+            hour = start_min // 60
 
-            # daily meeting cap
-            if pr.max_meetings_per_day:
-                df = calendars.get(p)
+        if prefer_morning:
+            row = violations[V_MORNING]
 
-                if df is not None and not df.empty:
-                    day_start = st.replace(hour=0, minute=0, second=0, microsecond=0)
-                    day_end = day_start + timedelta(days=1)
+            np.less(hour, MORNING_HOURS[0], out=row)
+            np.greater_equal(hour, MORNING_HOURS[1], out=tmp)
+            row |= tmp
 
-                    day_start_dt = pd.to_datetime(day_start.timestamp() * 1000, unit='ms')
-                    day_end_dt = pd.to_datetime(day_end.timestamp() * 1000, unit='ms')
+        if prefer_afternoon:
+            row = violations[V_AFTERNOON]
 
-                    todays = ((df["start_time"] >= day_start_dt) & (df["start_time"] < day_end_dt))
+            np.less(hour, AFTERNOON_HOURS[0], out=row)
+            np.greater_equal(hour, AFTERNOON_HOURS[1], out=tmp)
+            row |= tmp
 
-                    if todays.sum() >= pr.max_meetings_per_day:
-                        self.logger.trace(f"Slot {slot_desc} rejected: {p} already has max meetings for the day")
+        # daily meeting cap, counted once per distinct slot day
+        days = np.unique(start_day).tolist() if day_counts else []
+        trace_enabled = self.logger.isEnabledFor(TRACE)
 
-                        return False
+        for p, counts in day_counts.items():
+            capped = [day for day in days if counts.get(day, 0) >= prefs[p].max_meetings_per_day]
 
-        self.logger.trace(f"Slot {slot_desc} ACCEPTED: respects all preferences")
+            if capped:
+                if trace_enabled:
+                    self.logger.trace("%s reached the daily meeting cap on %s", p, capped)
 
-        return True
+                violations[V_DAILY_CAP] |= np.isin(start_day, np.array(capped, dtype="datetime64[D]"))
+
+        return violations
+
+    @staticmethod
+    def _daily_meeting_counts(
+            prefs: dict[str, ParticipantPreferences],
+            calendars: dict[str, pd.DataFrame]
+    ) -> dict[str, dict[date, int]]:
+        """
+        Counts the meetings of every capped participant per calendar day, so the daily cap
+        checks become lookups instead of a calendar scan per slot or per candidate day.
+        Days are truncated directly on the underlying datetime64 array and the counts are
+        returned as plain dicts, so no pandas Timestamp is built on lookup.
+
+        :param prefs: A dictionary mapping participant identifiers to their preferences.
+        :type prefs: dict[str, ParticipantPreferences]
+        :param calendars: A dictionary mapping participant identifiers to their calendars.
+        :type calendars: dict[str, pd.DataFrame]
+        :return: Meeting counts per day, only for participants with a `max_meetings_per_day`
+            and a non-empty calendar.
+        :rtype: dict[str, dict[date, int]]
+        """
+        day_counts = {}
+
+        for p, pr in prefs.items():
+            df = calendars.get(p)
+
+            if pr.max_meetings_per_day and df is not None and not df.empty:
+                days, counts = np.unique(df["start_time"].to_numpy(dtype="datetime64[D]"), return_counts=True)
+                day_counts[p] = dict(zip(days.tolist(), counts.tolist()))
+
+        return day_counts
 
     # =======================================================================
     # STRATEGIES
@@ -266,7 +353,8 @@ class NegotiationSpecialistAgent:
     def _strategy_duration_adjust(
             self,
             slots: list[SlotInfo],
-            prefs: dict[str, ParticipantPreferences]
+            prefs: dict[str, ParticipantPreferences],
+            long_enough: np.ndarray
     ) -> Optional[NegotiationResult]:
         """
         Adjusts the meeting duration strategy based on the minimum preferred duration
@@ -278,11 +366,14 @@ class NegotiationSpecialistAgent:
         available slots are incompatible with the reduced duration, this method
         returns None, indicating no adjustment is needed.
 
-        :param slots: List of available meeting slots with metadata.
+        :param slots: List of available meeting slots with metadata, ranked by confidence.
             Only slots meeting the smallest allowed duration are considered.
         :type slots: list[SlotInfo]
         :param prefs: Dictionary mapping participant identifiers to their preferences.
         :type prefs: dict[str, ParticipantPreferences]
+        :param long_enough: Mask of the slots lasting at least the smallest preferred
+            maximum duration, aligned with `slots`.
+        :type long_enough: np.ndarray
         :return: The result of the negotiation, including the proposed adjusted
             schedule, selected slot, alternative slot suggestions, and reasoning.
             Returns None if no adjustment is necessary or feasible.
@@ -299,35 +390,32 @@ class NegotiationSpecialistAgent:
             return None  # nobody needs a shorter meeting
 
         smallest_cap = min(caps)
-        self.logger.debug(f"Smallest preferred max duration: {smallest_cap} minutes")
+        self.logger.debug("Smallest preferred max duration: %s minutes", smallest_cap)
 
         if smallest_cap >= self.initial.default_duration:
-            self.logger.debug(f"Current duration ({self.initial.default_duration}) already within cap")
+            self.logger.debug("Current duration (%s) already within cap", self.initial.default_duration)
 
             return None  # current duration already within caps
 
-        # Generate new schedule
-        new_sched = self.initial.model_copy(deep=True)
-        new_sched.default_duration = smallest_cap
+        # Generate new schedule, a shallow copy is enough as only scalar fields are replaced
+        # (the alternative_durations list is shared with the initial schedule and never mutated)
+        new_sched = self.initial.model_copy(update={"default_duration": smallest_cap})
 
         self.logger.info(f"Adjusting duration from {self.initial.default_duration} to {smallest_cap} minutes")
 
-        compat = [
-            SlotInfo(**{**s.model_dump(), "duration_minutes": smallest_cap})
-            for s in slots
-            if s.duration_minutes >= smallest_cap  # slot is long enough
-        ]
+        compat = np.flatnonzero(long_enough)
 
-        self.logger.debug(f"Found {len(compat)} compatible slots with adjusted duration")
+        self.logger.debug("Found %d compatible slots with adjusted duration", len(compat))
 
-        if not compat:
+        if not len(compat):
             self.logger.debug("No compatible slots found with adjusted duration")
 
             return None
 
-        compat.sort(key=lambda s: s.confidence, reverse=True)
+        # only the kept slots are shortened
+        top = [slots[i].model_copy(update={"duration_minutes": smallest_cap}) for i in compat[:TOP_SLOTS]]
 
-        best_slot = compat[0]
+        best_slot = top[0]
 
         self.logger.info(
             f"Selected best slot: {best_slot.start_time}-{best_slot.end_time} (confidence: {best_slot.confidence})")
@@ -339,93 +427,70 @@ class NegotiationSpecialistAgent:
             strategy_choose=NegotiationStrategy.DURATION_ADJUSTMENT,
             reasoning=f"Reduced duration to {smallest_cap} min to respect "
                       "participants' preferred_max_duration.",
-            alternative_suggestions=compat[1:3]
+            alternative_suggestions=top[1:]
         )
 
 
     def _strategy_time_shift(
             self,
             slots: list[SlotInfo],
-            prefs: dict[str, ParticipantPreferences]
+            hard_mask: np.ndarray
     ) -> Optional[NegotiationResult]:
         """
         Attempts to find a viable slot for scheduling by relaxing certain participant
-        preferences such as "prefer morning" or "prefer afternoon". This strategy evaluates
-        each given slot by verifying that it adheres to the non-negotiable preferences of
-        all participants, while disregarding softer preferences like preferred times of
+        preferences such as "prefer morning" or "prefer afternoon". This strategy keeps
+        the slots that adhere to the non-negotiable preferences of all participants (see
+        `_violations`), while disregarding softer preferences like preferred times of
         the day.
 
         If a compliant slot is found, the method proposes a new schedule and returns the
-        result. The method sorts slots based on confidence, selects the most suitable slot,
-        and optionally provides up to two alternative suggestions if available.
+        result. The slots being ranked by confidence, the method selects the first compliant
+        slot and optionally provides up to two alternative suggestions if available.
 
-        :param slots: List of available time slots to evaluate.
-        :param prefs: Dictionary mapping participant identifiers to their scheduling
-                      preferences.
+        :param slots: List of available time slots to evaluate, ranked by confidence.
+        :param hard_mask: Hard preferences mask of the slots, aligned with `slots`.
         :return: An instance of `NegotiationResult` containing details about the proposed
                  schedule and reasoning for the adjustment. If no compliant slot is found,
                  `None` is returned.
         """
         self.logger.process_step("time_shift", "Attempting time-of-day preference relaxation")
-        self.logger.debug(f"Evaluating {len(slots)} slots for time-of-day flexibility")
-
-        # find participants who prefer morning/afternoon
-        def ok(slot: SlotInfo) -> bool:
-            st = datetime.strptime(slot.start_time, "%Y-%m-%d %H:%M")
-            et = datetime.strptime(slot.start_time, "%Y-%m-%d %H:%M")
+        self.logger.debug("Evaluating %d slots for time-of-day flexibility", len(slots))
 
-            lunch = (time(12, 0), time(13, 0))
-
-            for pr in prefs.values():
-
-                if pr.no_meetings_before and st.time() < pr.no_before():
-                    return False
-
-                if pr.no_meetings_after and et.time() > pr.no_after():
-                    return False
-
-                if pr.avoid_lunch_time and (lunch[0] <= st.time() < lunch[1] or lunch[0] < et.time() <= lunch[1]):
-                    return False
-
-                if pr.preferred_max_duration and slot.duration_minutes > pr.preferred_max_duration:
-                    return False
-            return True
-
-        viable = [s for s in slots if ok(s)]
+        viable = np.flatnonzero(hard_mask)
 
         self.logger.info(f"Found {len(viable)} viable slots after relaxing time-of-day preferences")
 
-        if not viable:
+        if not len(viable):
             self.logger.debug("No viable slots found after relaxing time-of-day preferences")
 
             return None
 
-        viable.sort(key=lambda s: s.confidence, reverse=True)
-        best_slot = viable[0]
+        top = [slots[i] for i in viable[:TOP_SLOTS]]
+        best_slot = top[0]
 
-        self.logger.debug(f"Best slot: {best_slot.start_time}-{best_slot.end_time} (confidence: {best_slot.confidence})")
+        self.logger.debug("Best slot: %s-%s (confidence: %s)",
+                          best_slot.start_time, best_slot.end_time, best_slot.confidence)
 
 
         # Generate a new schedule
-        new_sched = self.initial.model_copy(deep=True)
-        new_sched.schedule_day = datetime.strptime(viable[0].start_time, "%Y-%m-%d %H:%M")
+        new_sched = self.initial.model_copy(update={"schedule_day": _parse_slot_time(best_slot.start_time)})
 
         self.logger.info(f"Adjusted schedule day to {new_sched.schedule_day}")
 
         return NegotiationResult(
             outcome=NegotiationOutcome.COMPROMISE_PROPOSED,
             proposed_schedule=new_sched,
-            selected_slot=viable[0],
+            selected_slot=best_slot,
             strategy_choose=NegotiationStrategy.TOD_SHIFTING,
             reasoning="Relaxed morning/afternoon *preference* to fit an otherwise compliant slot.",
-            alternative_suggestions=viable[1:3]
+            alternative_suggestions=top[1:]
         )
 
     def _strategy_alternative_day(
             self,
             slots: list[SlotInfo],
             prefs: dict[str, ParticipantPreferences],
-            calendars: dict[str, pd.DataFrame]
+            day_counts: dict[str, dict[date, int]]
     ) -> Optional[NegotiationResult]:
         """
         Attempts to propose an alternative day for meeting scheduling based on participant
@@ -439,9 +504,9 @@ class NegotiationSpecialistAgent:
         :param prefs: A dictionary mapping participant names (as strings) to their
             `ParticipantPreferences`.
         :type prefs: dict[str, ParticipantPreferences]
-        :param calendars: A dictionary mapping participant names (as strings) to their
-            individual calendars represented as pandas DataFrames.
-        :type calendars: dict[str, pd.DataFrame]
+        :param day_counts: A dictionary mapping participant names (as strings) to their
+            number of meetings per calendar day, see `_daily_meeting_counts`.
+        :type day_counts: dict[str, dict[date, int]]
         :return: A `NegotiationResult` object encapsulating the proposed schedule,
             reasoning, and alternative suggestions, or `None` if no suitable alternative day
             is found within the specified constraints.
@@ -457,53 +522,39 @@ class NegotiationSpecialistAgent:
         base_day = self.initial.schedule_day
 
         self.logger.info(f"Searching for alternative days around {base_day.strftime('%Y-%m-%d')}")
-        self.logger.debug(f"Max alternative days: {self.initial.max_alternative_days}")
+        self.logger.debug("Max alternative days: %s", self.initial.max_alternative_days)
+
+        # Days on which at least one capped participant is already full, with the first such participant
+        blocked: dict[date, tuple[str, int]] = {}
+
+        for p, counts in day_counts.items():
+            for day, todays in counts.items():
+                if todays >= prefs[p].max_meetings_per_day:
+                    blocked.setdefault(day, (p, todays))
 
         for offset in range(1, self.initial.max_alternative_days + 1):
 
             for sign in (+1, -1):
                 day = base_day + timedelta(days=sign * offset)
 
-                self.logger.debug(f"Evaluating day: {day.strftime('%Y-%m-%d')} (offset: {sign * offset})")
+                self.logger.debug("Evaluating day: %s (offset: %d)", day.date(), sign * offset)
 
                 if day.weekday() >= 5:  # skip weekends
-                    self.logger.debug(f"Skipping weekend day: {day.strftime('%Y-%m-%d')}")
+                    self.logger.debug("Skipping weekend day: %s", day.date())
 
                     continue
 
                 # check max_meetings_per_day for each participant
-                day_ok = True
+                if day.date() in blocked:
+                    p, todays = blocked[day.date()]
 
-                for p, pref in prefs.items():
-
-                    if not pref.max_meetings_per_day:  # no cap
-                        continue
-
-                    df = calendars.get(p)
-
-                    if df is None or df.empty:  # no meetings stored
-                        continue
-
-                    start_ms = day.timestamp() * 1000
-                    end_ms = (day + timedelta(days=1)).timestamp() * 1000
-                    day_start_dt = pd.to_datetime(start_ms, unit='ms')
-                    day_end_dt = pd.to_datetime(end_ms, unit='ms')
-                    todays = ((df["start_time"] >= day_start_dt) & (df["start_time"] < day_end_dt)).sum()
-
-                    if todays >= pref.max_meetings_per_day:
-                        self.logger.debug(f"Participant {p} already has {todays} meetings on {day.strftime('%Y-%m-%d')}")
-                        day_ok = False
-
-                        break
-
-                if not day_ok:
-                    self.logger.debug(f"Day {day.strftime('%Y-%m-%d')} exceeds meeting caps for at least one participant")
+                    self.logger.debug("Participant %s already has %d meetings on %s", p, todays, day.date())
+                    self.logger.debug("Day %s exceeds meeting caps for at least one participant", day.date())
 
                     continue
 
                 # Generate new schedule
-                new_sched = self.initial.model_copy(deep=True)
-                new_sched.schedule_day = day
+                new_sched = self.initial.model_copy(update={"schedule_day": day})
 
                 self.logger.decision("alternative_day",
                                      f"Selected alternative day: {day.strftime('%Y-%m-%d')}",
@@ -527,7 +578,7 @@ class NegotiationSpecialistAgent:
     def _strategy_relax_hours(
             self,
             slots: list[SlotInfo],
-            prefs: dict[str, ParticipantPreferences],
+            hard_mask: np.ndarray
     ) -> Optional[NegotiationResult]:
         """
         Implements a strategy to relax constraints and extend corporate working hours slightly
@@ -539,78 +590,42 @@ class NegotiationSpecialistAgent:
         relies on filtering out slots that violate explicit preferences such as maximum
         duration, no-meeting times, or lunch-time avoidance.
 
-        :param slots: List of SlotInfo objects representing meeting time slots.
-        :param prefs: Dictionary mapping participant identifiers to their corresponding
-                      ParticipantPreferences.
+        :param slots: List of SlotInfo objects representing meeting time slots, ranked by confidence.
+        :param hard_mask: Hard preferences mask of the slots, aligned with `slots`.
         :return:
             Returns a NegotiationResult object containing the outcome, a proposed schedule,
             the selected slot, the strategy used, and alternative slot suggestions if any
             slots meet the criteria. If no slots are suitable, returns None.
         """
         self.logger.process_step("relax_hours", "Attempting to relax working hours constraints")
-        self.logger.debug(f"Evaluating {len(slots)} slots with relaxed working hours")
-
-        widened_slots = []
-
-        for s in slots:
-            st = datetime.strptime(s.start_time, "%Y-%m-%d %H:%M")
-            et = datetime.strptime(s.end_time, "%Y-%m-%d %H:%M")
-
-            # Accept everything except explicit before/after caps & lunch
-            allowed = True
-            lunch = (time(12, 0), time(13, 0))
+        self.logger.debug("Evaluating %d slots with relaxed working hours", len(slots))
 
-            for pr in prefs.values():
-
-                if pr.no_meetings_before and st.time() < pr.no_before():
-                    allowed = False
-
-                    break
-
-                if pr.no_meetings_after and et.time() > pr.no_after():
-                    allowed = False
-
-                    break
-
-                if pr.avoid_lunch_time and (lunch[0] <= st.time() < lunch[1] or
-                                            lunch[0] < et.time() <= lunch[1]):
-                    allowed = False
-
-                    break
-
-                if pr.preferred_max_duration and s.duration_minutes > pr.preferred_max_duration:
-                    allowed = False
-
-                    break
-
-            if allowed:
-                self.logger.trace(f"Slot {s.start_time}-{s.end_time} accepted with relaxed working hours")
-                widened_slots.append(s)
+        # Accept everything except explicit before/after caps, lunch & max duration
+        widened_slots = np.flatnonzero(hard_mask)
 
         self.logger.info(f"Found {len(widened_slots)} viable slots with relaxed working hours")
 
-        if not widened_slots:
+        if not len(widened_slots):
             self.logger.debug("No viable slots found even with relaxed working hours")
 
             return None
 
-        widened_slots.sort(key=lambda s: s.confidence, reverse=True)
-        best_slot = widened_slots[0]
+        top = [slots[i] for i in widened_slots[:TOP_SLOTS]]
+        best_slot = top[0]
 
-        self.logger.debug(
-            f"Best slot: {best_slot.start_time}-{best_slot.end_time} (confidence: {best_slot.confidence})")
+        self.logger.debug("Best slot: %s-%s (confidence: %s)",
+                          best_slot.start_time, best_slot.end_time, best_slot.confidence)
 
 
-        begin = datetime.strptime(self.initial.working_hours_start, "%H:%M")
-        end = datetime.strptime(self.initial.working_hours_end, "%H:%M")
+        begin = _hhmm_to_minutes(self.initial.working_hours_start)
+        end = _hhmm_to_minutes(self.initial.working_hours_end)
 
-        new_start = (begin - timedelta(minutes=30)).strftime("%H:%M")
-        new_end = (end + timedelta(minutes=30)).strftime("%H:%M")
+        new_start = _minutes_to_hhmm(begin - 30)
+        new_end = _minutes_to_hhmm(end + 30)
 
         # Generate new schedule
-        new_sched = self.initial.model_copy(deep=True)
-        new_sched.working_hours_start = new_start
-        new_sched.working_hours_end = new_end
+        new_sched = self.initial.model_copy(update={"working_hours_start": new_start,
+                                                    "working_hours_end": new_end})
 
         self.logger.info(
             f"Extended working hours: {self.initial.working_hours_start}-{self.initial.working_hours_end} → {new_start}-{new_end}")
@@ -618,9 +633,9 @@ class NegotiationSpecialistAgent:
         return NegotiationResult(
             outcome=NegotiationOutcome.COMPROMISE_PROPOSED,
             proposed_schedule=new_sched,
-            selected_slot=widened_slots[0],
+            selected_slot=best_slot,
             strategy_choose=NegotiationStrategy.RELAX_CONSTRAINTS,
             reasoning="Extended corporate working hours by 30 min to accommodate a slot "
                       "respecting all hard preferences.",
-            alternative_suggestions=widened_slots[1:3]
+            alternative_suggestions=top[1:]
         )
\ No newline at end of file
@@ -1,11 +1,30 @@
-from datetime import datetime, time, timedelta
-from typing import Any, Optional
+from datetime import datetime, timedelta
+from itertools import repeat
+from typing import Any, NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 import logging as python_logging
 
-from multi_agent.config.models import SlotInfo
-from multi_agent.logger.AgentLogger import AgentLogger
+from multi_agent.config.models import ParticipantPreferences, SlotInfo
+from multi_agent.logger.AgentLogger import AgentLogger, TRACE
+
+# Meetings ending or starting this close to a slot make it back-to-back
+BUFFER_MINUTES = 15
+
+
+class PackedCalendar(NamedTuple):
+    """
+    Calendar of a participant converted to the arrays used for searching and scoring slots,
+    built once by `ScheduleAnalystAgent.pack_calendar` and reused while the calendar stays the same.
+    """
+    calendar: Optional[pd.DataFrame]  # source DataFrame, the arrays are only valid for this object
+    busy_start: np.ndarray  # datetime64[ns] start of each meeting, in calendar order
+    busy_end: np.ndarray  # datetime64[ns] end of each meeting, in calendar order
+    start_sorted: np.ndarray  # sorted meeting starts, NaT left out
+    end_sorted: np.ndarray  # sorted meeting ends, NaT left out
+    days: np.ndarray  # sorted datetime64[D] days having meetings
+    day_counts: np.ndarray  # number of meetings on each of `days`
 
 
 class ScheduleAnalystAgent:
@@ -27,13 +46,14 @@ class ScheduleAnalystAgent:
         self.timezone = timezone
         self.min_slot_duration = min_slot_duration
 
+        # Working hours as (hour, minute) pairs, parsed once rather than on every search
+        start_time, end_time = (datetime.strptime(value, '%H:%M').time() for value in working_hours)
+        self._start_hm = (start_time.hour, start_time.minute)
+        self._end_hm = (end_time.hour, end_time.minute)
+
         self.logger = logger or AgentLogger(agent_name="ScheduleAnalyst", log_level=python_logging.INFO)
         self.logger.info(f"Initialized ScheduleAnalyst with working hours {working_hours}, timezone {timezone}")
-        self.logger.debug(f"Min slot duration: {min_slot_duration} minutes")
-
-    def _parse_time(self, tstr: str) -> time:
-        """Parse 'HH:MM' string to a time object."""
-        return datetime.strptime(tstr, '%H:%M').time()
+        self.logger.debug("Min slot duration: %s minutes", min_slot_duration)
 
     def find_free_slots(self,
                         participants_data: dict[str, dict],
@@ -44,7 +64,9 @@ class ScheduleAnalystAgent:
         Find available meeting slots across multiple calendars.
 
         Args:
-            participants_data: Dictionary of participant data including calendars and preferences
+            participants_data: Dictionary of participant data including calendars and preferences.
+                The packed calendar of each participant is stored under `_packed` and reused by
+                later calls while the calendar is the same (see `pack_calendar`)
             meeting_duration: Duration in minutes
             schedule_day: Day to schedule for (defaults to today)
 
@@ -53,11 +75,10 @@ class ScheduleAnalystAgent:
         """
         self.logger.process_step("find_free_slots", "Finding available meeting slots")
         self.logger.data_in("Main", f"Received data for {len(participants_data)} participants")
-        self.logger.debug(f"Meeting duration: {meeting_duration} minutes")
+        self.logger.debug("Meeting duration: %s minutes", meeting_duration)
 
-        start_hour, end_hour = self.working_hours
-        start_time_obj = self._parse_time(start_hour)
-        end_time_obj = self._parse_time(end_hour)
+        start_hour, start_minute = self._start_hm
+        end_hour, end_minute = self._end_hm
 
         # Set default date range if not provided
         if schedule_day is None:
@@ -65,31 +86,33 @@ class ScheduleAnalystAgent:
             self.logger.debug("No schedule day provided, using current date")
         else:
             start_date = schedule_day
-            self.logger.debug(f"Using provided schedule day: {start_date.strftime('%Y-%m-%d')}")
+            self.logger.debug("Using provided schedule day: %s", start_date.date())
 
-        start_date = start_date.replace(hour=start_time_obj.hour, minute=start_time_obj.minute, second=0, microsecond=0)
-        end_date = start_date.replace(hour=end_time_obj.hour, minute=end_time_obj.minute, second=0, microsecond=0)
+        start_date = start_date.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
+        end_date = start_date.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
 
-        self.logger.debug(
-            f"Search period: {start_date.strftime('%Y-%m-%d %H:%M')} to {end_date.strftime('%Y-%m-%d %H:%M')}")
+        self.logger.debug("Search period: %s to %s", start_date, end_date)
 
         # Load and combine all calendar data
         self.logger.process_step("calendar_processing", "Processing participant calendars")
 
-        all_busy_slots = []
+        # Combine all busy slots, only their start and end times are needed so the packed arrays
+        # of the calendars are concatenated instead of the DataFrames
+        packed_calendars = []
 
         for participant, participant_data in participants_data.items():
-            calendar_df = participant_data['calendar']
+            packed = self._packed_calendar(participant_data)
 
-            self.logger.debug(
-                f"Processing calendar for {participant} with {len(calendar_df) if not calendar_df.empty else 0} entries")
+            self.logger.debug("Processing calendar for %s with %d entries", participant, len(packed.busy_start))
 
-            all_busy_slots.append(calendar_df)
+            packed_calendars.append(packed)
 
-        # Combine all busy slots
-        combined_busy = pd.concat(all_busy_slots, ignore_index=True) if all_busy_slots else pd.DataFrame()
+        busy_start = np.concatenate([packed.busy_start for packed in packed_calendars]) \
+            if packed_calendars else np.empty(0, dtype='datetime64[ns]')
+        busy_end = np.concatenate([packed.busy_end for packed in packed_calendars]) \
+            if packed_calendars else np.empty(0, dtype='datetime64[ns]')
 
-        self.logger.info(f"Combined calendar has {len(combined_busy)} busy slots")
+        self.logger.info(f"Combined calendar has {len(busy_start)} busy slots")
 
         # Generate potential time slots, from schedule day and next day (only working days)
         self.logger.process_step("slot_generation", "Generating potential time slots")
@@ -103,7 +126,8 @@ class ScheduleAnalystAgent:
 
         available_slots = self._filter_available_slots(
             potential_slots=potential_slots,
-            busy_df=combined_busy
+            busy_start=busy_start,
+            busy_end=busy_end
         )
 
         self.logger.info(f"Found {len(available_slots)} available slots after filtering conflicts")
@@ -126,7 +150,7 @@ class ScheduleAnalystAgent:
             self.logger.info(f"Top slot has confidence score of {top_slots[0].confidence:.2f}")
 
             for i, slot in enumerate(top_slots):
-                self.logger.debug(f"Slot {i + 1}: {slot.start_time} - {slot.end_time} (Score: {slot.score:.2f})")
+                self.logger.debug("Slot %d: %s - %s (Score: %.2f)", i + 1, slot.start_time, slot.end_time, slot.score)
         else:
             self.logger.warning("No available slots found after analysis")
 
@@ -137,78 +161,104 @@ class ScheduleAnalystAgent:
     def _generate_time_slots(self, start_date: datetime, end_date: datetime, duration: int) -> list[
         tuple[datetime, datetime]]:
         """
-        Generates a list of time slots within the specified date range and duration. The method skips weekends,
-        ensuring time slot generation occurs from Monday to Friday only. Each generated time slot starts at
-        a given time and lasts for the specified duration. Time slots are created at specified intervals
-        and fit within the overall provided range.
+        Generates a list of time slots within the working hours of a single day. No slot is generated
+        on weekends, ensuring time slot generation occurs from Monday to Friday only. Each generated time
+        slot lasts for the specified duration, and slots start one minimum slot duration apart and fit
+        within the provided range.
 
         :param start_date: The starting datetime for time slot generation.
         :type start_date: datetime
-        :param end_date: The ending datetime for time slot generation.
+        :param end_date: The ending datetime for time slot generation, on the same day as `start_date`.
         :type end_date: datetime
         :param duration: The duration of each time slot in minutes.
         :type duration: int
         :return: A list of tuples where each tuple contains the start and end datetime for each time slot.
         :rtype: list[tuple[datetime, datetime]]
         """
-        self.logger.debug(f"Generating time slots from {start_date} to {end_date} with duration {duration} minutes")
-
-        slots = []
-        current_time = start_date
+        self.logger.debug("Generating time slots from %s to %s with duration %s minutes", start_date, end_date, duration)
 
-        while current_time < end_date:
+        if start_date.weekday() >= 5:  # Monday = 0, Friday = 4
+            self.logger.debug("Skipping weekend day: %s", start_date.date())
 
-            if current_time.weekday() < 5:  # Monday = 0, Friday = 4
+            return []
 
-                while current_time + timedelta(minutes=duration) <= end_date:
-                    slots.append((current_time, current_time + timedelta(minutes=self.min_slot_duration)))
-                    current_time += timedelta(minutes=self.min_slot_duration)
+        # Every start, one slot interval apart, that leaves room for the meeting before the end of the range
+        step = timedelta(minutes=self.min_slot_duration)
+        starts = pd.date_range(start_date, end_date - timedelta(minutes=duration), freq=step)
 
-            else:
-                self.logger.debug(f"Skipping weekend day: {current_time.strftime('%Y-%m-%d')}")
+        slots = list(zip(starts.to_pydatetime(), (starts + step).to_pydatetime()))
 
-                break
-
-        self.logger.debug(f"Generated {len(slots)} potential time slots")
+        self.logger.debug("Generated %d potential time slots", len(slots))
 
         return slots
 
     def _filter_available_slots(self, potential_slots: list[tuple[datetime, datetime]],
-                                busy_df: pd.DataFrame) -> list[tuple[datetime, datetime]]:
+                                busy_start: np.ndarray, busy_end: np.ndarray) -> list[tuple[datetime, datetime]]:
         """
         Filters the list of potential time slots by excluding those that conflict with busy periods
-        defined in the provided DataFrame. This method checks the overlap between the provided
+        defined by the provided start and end times. This method checks the overlap between the provided
         time slots and the busy periods to return only the available slots.
 
         :param potential_slots: A list of tuples, where each tuple contains a start and end time
             (datetime, datetime) representing the potential time slots to check.
-        :param busy_df: A pandas DataFrame that contains busy time periods with 'start_time'
-            and 'end_time' columns representing the start and end time of each busy period.
+        :param busy_start: A datetime64 array with the start time of each busy period.
+        :param busy_end: A datetime64 array with the end time of each busy period, aligned with `busy_start`.
         :return: A list of tuples, where each tuple contains a start and end time
             (datetime, datetime) representing the available slots that do not conflict with
             the busy periods.
         """
-        self.logger.debug(
-            f"Filtering {len(potential_slots)} potential slots against {len(busy_df) if not busy_df.empty else 0} busy periods")
+        self.logger.debug("Filtering %d potential slots against %d busy periods", len(potential_slots), len(busy_start))
 
-        if busy_df.empty:
+        if not len(busy_start):
             self.logger.debug("No busy slots found, all potential slots are available")
 
             return potential_slots
 
-        available_slots = []
+        # The busy periods are merged into their disjoint union, sorted by start. The merged periods
+        # starting before a slot ends are a prefix, and as their ends increase too the slot is free
+        # iff the last of them ends by the slot start: one searchsorted per slot, O((N + M) log M)
+        merged_start, merged_end = self._merge_busy_periods(busy_start, busy_end)
+
+        slot_start = np.array([start for start, _ in potential_slots], dtype='datetime64[ns]')
+        slot_end = np.array([end for _, end in potential_slots], dtype='datetime64[ns]')
 
-        for slot_start, slot_end in potential_slots:
-            # Check for conflicts
-            conflicts = busy_df[(busy_df['start_time'] < slot_end) & (busy_df['end_time'] > slot_start)]
+        started = np.searchsorted(merged_start, slot_end, side='left')  # merged periods starting before the slot ends
+        free = started == 0
+        free[~free] = merged_end[started[~free] - 1] <= slot_start[~free]
 
-            if conflicts.empty:
-                available_slots.append((slot_start, slot_end))
+        available_slots = [slot for slot, is_free in zip(potential_slots, free.tolist()) if is_free]
 
-        self.logger.debug(f"Found {len(available_slots)} slots without conflicts")
+        self.logger.debug("Found %d slots without conflicts", len(available_slots))
 
         return available_slots
 
+    @staticmethod
+    def _merge_busy_periods(busy_start: np.ndarray, busy_end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Merges overlapping or touching busy periods into disjoint periods sorted by start time,
+        their complement being the free time. Periods with a missing (NaT) bound are ignored
+        as they never conflict with a slot.
+
+        :param busy_start: A datetime64 array with the start time of each busy period.
+        :param busy_end: A datetime64 array with the end time of each busy period.
+        :return: The start and end times of the merged periods, both increasing.
+        """
+        valid = ~(np.isnat(busy_start) | np.isnat(busy_end))
+        order = np.argsort(busy_start[valid], kind='stable')
+
+        start_sorted = busy_start[valid][order]
+
+        if not len(start_sorted):
+            return start_sorted, busy_end[valid]
+
+        # latest end so far, a period starting after it opens a new merged period
+        end_running_max = np.maximum.accumulate(busy_end[valid][order])
+
+        opens = np.flatnonzero(np.r_[True, start_sorted[1:] > end_running_max[:-1]])
+        closes = np.r_[opens[1:] - 1, len(start_sorted) - 1]
+
+        return start_sorted[opens], end_running_max[closes]
+
     def _score_slots(
             self,
             available_slots: list[tuple[datetime, datetime]],
@@ -220,6 +270,10 @@ class ScheduleAnalystAgent:
         and slot duration. Each slot is annotated with calculated scores, notes, and
         additional metadata for scheduling optimization.
 
+        The slot times are converted to arrays once and every participant scores all the
+        slots at once (see `_calculate_slot_scores`), instead of one call per slot and
+        participant. The notes are built afterwards from the outcome of the checks.
+
         :param available_slots: A list of tuples representing the available time slots.
             Each tuple contains two datetime objects: the start and end of the slot.
         :param participants_data: A dictionary where keys are participant names (str) and values
@@ -228,281 +282,402 @@ class ScheduleAnalystAgent:
         :return: A list of SlotInfo objects, each representing a scored and annotated time
             slot, sorted in descending order of score.
         """
-        self.logger.debug(f"Scoring {len(available_slots)} available slots")
+        self.logger.debug("Scoring %d available slots", len(available_slots))
 
-        scored_slots = []
+        slot_start = pd.DatetimeIndex([start for start, _ in available_slots])
+        slot_end = pd.DatetimeIndex([end for _, end in available_slots])
+
+        participants = list(participants_data.keys())
+        participant_scores = {}
+        participant_notes = {}
+        total_score = np.zeros(len(available_slots))
 
-        for slot_start, slot_end in available_slots:
-            self.logger.trace(
-                f"Scoring slot: {slot_start.strftime('%Y-%m-%d %H:%M')} - {slot_end.strftime('%Y-%m-%d %H:%M')}")
+        for participant, participant_data in participants_data.items():
+            scores, checks = self._calculate_slot_scores(
+                slot_start=slot_start,
+                slot_end=slot_end,
+                duration=duration,
+                participant_name=participant,
+                participant_data=participant_data
+            )
+            notes = self._build_slot_notes(participant, participant_data['preferences'], duration, checks, scores)
 
-            participant_scores = []
-            participant_notes = {}
+            # Summed participant after participant, as the per-slot average used to be
+            total_score += scores
+            participant_scores[participant] = scores.tolist()
+            participant_notes[participant] = notes
 
-            for participant, participant_data in participants_data.items():
+        avg_score_array = total_score / len(participants) if participants else total_score
+        avg_scores = avg_score_array.tolist()
 
-                score, notes = self._calculate_slot_score_with_notes(
-                    slot_start=slot_start,
-                    slot_end=slot_end,
-                    duration=duration,
-                    participant_name=participant,
-                    participant_data=participant_data
-                )
+        # Slots ranked by decreasing score, stable so equal scores keep their chronological order
+        order = np.argsort(-avg_score_array, kind='stable').tolist()
 
-                participant_scores.append(score)
-                participant_notes[participant] = notes
+        # slot fields formatted for all the slots at once
+        start_times = slot_start.strftime('%Y-%m-%d %H:%M').tolist()
+        end_times = slot_end.strftime('%Y-%m-%d %H:%M').tolist()
+        days_of_week = slot_start.strftime('%A').tolist()
 
-                self.logger.trace(f"Participant {participant} score: {score:.2f}")
+        scored_slots = []
+        trace_enabled = self.logger.isEnabledFor(TRACE)
 
-            avg_score = sum(participant_scores) / len(participant_scores) if participant_scores else 0.0
+        for i in order:
+            start = available_slots[i][0]
+            avg_score = avg_scores[i]
 
-            self.logger.trace(f"Average score for slot: {avg_score:.2f}")
+            if trace_enabled:
+                self.logger.trace("Average score for slot %s: %.2f", start, avg_score)
 
-            slot_info = SlotInfo(
-                start_time=slot_start.strftime('%Y-%m-%d %H:%M'),
-                end_time=slot_end.strftime('%Y-%m-%d %H:%M'),
+            # Every field is built here from already checked values, so pydantic validation is skipped
+            slot_info = SlotInfo.model_construct(
+                start_time=start_times[i],
+                end_time=end_times[i],
                 duration_minutes=duration,
                 confidence=min(avg_score, 1.0),
-                participants=list(participants_data.keys()),
-                participant_scores=participant_scores,
-                participant_notes=participant_notes,
-                notes=self._generate_slot_notes(slot_start, avg_score),
-                day_of_week=slot_start.strftime('%A'),
+                participants=list(participants),
+                participant_scores=[participant_scores[p][i] for p in participants],
+                participant_notes={p: participant_notes[p][i] for p in participants},
+                notes=self._generate_slot_notes(start, avg_score),
+                day_of_week=days_of_week[i],
                 score=avg_score
             )
 
             scored_slots.append(slot_info)
 
-        scored_slots.sort(key=lambda x: x.score, reverse=True)
-
-        self.logger.debug(f"Sorted {len(scored_slots)} slots by score")
+        self.logger.debug("Sorted %d slots by score", len(scored_slots))
 
         return scored_slots
 
-    def _calculate_slot_score_with_notes(
+    def _calculate_slot_scores(
             self,
-            slot_start: datetime,
-            slot_end: datetime,
+            slot_start: pd.DatetimeIndex,
+            slot_end: pd.DatetimeIndex,
             duration: int,
             participant_name: str,
             participant_data: dict[str, Any]
-    ) -> tuple[float, list[str]]:
+    ) -> tuple[np.ndarray, dict[str, Any]]:
         """
-        Calculates the suitability score and notes for a meeting slot for a specified participant
-        based on their preferences and existing schedule.
+        Calculates the suitability scores of meeting slots for a specified participant based
+        on their preferences and existing schedule.
 
         The function evaluates several aspects of the participant's preferences, including time constraints,
         preferred meeting times, preferred meeting durations, avoidance of lunch hours, and maximum number of
         meetings per day. It also considers the participant's calendar for conflicting meetings and busy periods.
-        Each factor influences the overall score, which is clamped between 0.0 and 1.0. Additionally,
-        detailed notes are generated to explain how each preference is respected or violated.
-
-        :param slot_start: The starting time of the proposed meeting slot.
-        :type slot_start: datetime
-        :param slot_end: The ending time of the proposed meeting slot.
-        :type slot_end: datetime
-        :param duration: The duration of the meeting slot in minutes.
+        Each factor influences the overall score, which is clamped between 0.0 and 1.0.
+
+        Every check is evaluated over all the slots at once with NumPy arrays, the adjustments being
+        applied in the same order as a per-slot evaluation so the scores are identical. The scoring
+        is purely numeric, the outcome of each check is returned for `_build_slot_notes`.
+
+        :param slot_start: The starting times of the proposed meeting slots.
+        :type slot_start: pd.DatetimeIndex
+        :param slot_end: The ending times of the proposed meeting slots.
+        :type slot_end: pd.DatetimeIndex
+        :param duration: The duration of the meeting slots in minutes.
         :type duration: int
         :param participant_name: The name of the participant being assessed.
         :type participant_name: str
         :param participant_data: Information about the participant, including preferences and schedule.
         :type participant_data: dict[str, Any]
-        :return: A tuple containing the final suitability score (float) and a list of explanatory notes (list[str]).
-        :rtype: tuple[float, list[str]]
+        :return: A tuple containing the final suitability score of each slot (np.ndarray) and the
+            outcome of each evaluated check keyed by check name (dict[str, Any]).
+        :rtype: tuple[np.ndarray, dict[str, Any]]
         """
 
-        self.logger.trace(f"Calculating score for {participant_name} at {slot_start.strftime('%H:%M')}")
+        self.logger.trace("Calculating scores for %s over %d slots", participant_name, len(slot_start))
 
-        score = 0.5  # Base score
-        notes = []
+        start_hour = slot_start.hour.to_numpy()
+        end_hour = slot_end.hour.to_numpy()
+
+        score = np.full(len(slot_start), 0.5)  # Base score
+        checks: dict[str, Any] = {'start_hour': start_hour, 'end_hour': end_hour}
         prefs = participant_data['preferences']
-        calendar = participant_data['calendar']
+        packed = self._packed_calendar(participant_data)
 
         # Respect no_meetings_before and no_meetings_after
         if prefs.no_meetings_before:
+            before = prefs.no_before_min // 60  # compared on the hour
 
-            before = int(prefs.no_meetings_before.split(':')[0]) if isinstance(prefs.no_meetings_before, str) else int(
-                prefs.no_meetings_before)
-
-            if slot_start.hour < before:
-                score -= 0.3
-                notes.append(
-                    f"[{participant_name}] Slot starts at {slot_start.hour}:00, but prefers no meetings before {prefs.no_meetings_before}")
-
-                self.logger.trace(f"{participant_name}: Violated no_meetings_before preference")
-
-            else:
-                notes.append(
-                    f"[{participant_name}] Slot respects no-meetings-before preference of {prefs.no_meetings_before}")
+            checks['before_violated'] = violated = start_hour < before
+            score[violated] -= 0.3
 
         if prefs.no_meetings_after:
-            after = int(prefs.no_meetings_after.split(':')[0]) if isinstance(prefs.no_meetings_after, str) else int(
-                prefs.no_meetings_after)
-
-            if slot_end.hour > after:
-                score -= 0.3
-                notes.append(
-                    f"[{participant_name}] Slot ends at {slot_end.hour}:00, but prefers no meetings after {prefs.no_meetings_after}")
-
-                self.logger.trace(f"{participant_name}: Violated no_meetings_after preference")
+            after = prefs.no_after_min // 60  # compared on the hour
 
-            else:
-                notes.append(
-                    f"[{participant_name}] Slot respects no-meetings-after preference of {prefs.no_meetings_after}")
+            checks['after_violated'] = violated = end_hour > after
+            score[violated] -= 0.3
 
         # Prefer morning/afternoon
         if prefs.prefer_morning:
+            checks['morning'] = aligned = (6 <= start_hour) & (start_hour < 12)
+            score[aligned] += 0.2
 
-            if 6 <= slot_start.hour < 12:
-                score += 0.2
-                notes.append(f"[{participant_name}] Slot aligns with morning preference")
+        if prefs.prefer_afternoon:
+            checks['afternoon'] = aligned = (13 <= start_hour) & (start_hour < 18)
+            score[aligned] += 0.2
 
-                self.logger.trace(f"{participant_name}: Morning preference satisfied")
+        # Avoid lunch time
+        if prefs.avoid_lunch_time:
+            checks['lunch'] = conflict = ((12 <= start_hour) & (start_hour < 13)) | ((12 < end_hour) & (end_hour <= 13))
+            score[conflict] -= 0.2
 
-            else:
-                notes.append(f"[{participant_name}] Slot does not align with morning preference")
+        # Preferred duration, the same for every slot
+        if prefs.preferred_max_duration:
+            checks['duration_within'] = duration <= prefs.preferred_max_duration
 
-                self.logger.trace(f"{participant_name}: Morning preference not satisfied")
+            if checks['duration_within']:
+                score += 0.1
 
-        if prefs.prefer_afternoon:
+        # Check calendar for busy periods
+        if len(packed.busy_start):
+            # meetings per day counted once on the datetime64 days, then looked up for the day of each slot
+            meeting_count = self._meetings_per_slot_day(packed, slot_start)
 
-            if 13 <= slot_start.hour < 18:
-                score += 0.2
-                notes.append(f"[{participant_name}] Slot aligns with afternoon preference")
+            capped = meeting_count >= prefs.max_meetings_per_day if prefs.max_meetings_per_day \
+                else np.zeros(len(meeting_count), dtype=bool)
+            quite_busy = ~capped & (meeting_count >= 4)
+            moderately_busy = ~capped & ~quite_busy & (meeting_count >= 2)
 
-                self.logger.trace(f"{participant_name}: Afternoon preference satisfied")
+            score[capped] -= 0.3
+            score[quite_busy] -= 0.2
+            score[moderately_busy] -= 0.1
 
-            else:
-                notes.append(f"[{participant_name}] Slot does not align with afternoon preference")
+            checks['meeting_count'] = meeting_count
+            checks['capped'] = capped
 
-                self.logger.trace(f"{participant_name}: Afternoon preference not satisfied")
+            # Check for meetings close to the slots: ending within the buffer before the slot
+            # starts, or starting within the buffer after it ends, counted by binary searches
+            # on the sorted meeting times
+            buffer = np.timedelta64(BUFFER_MINUTES, 'm')
 
-        # Avoid lunch time
-        if prefs.avoid_lunch_time:
+            starts = slot_start.to_numpy()
+            ends = slot_end.to_numpy()
+            meeting_start = packed.start_sorted
+            meeting_end = packed.end_sorted
+
+            ending_before = (np.searchsorted(meeting_end, starts, side='right') >
+                             np.searchsorted(meeting_end, starts - buffer, side='right'))
+            starting_after = (np.searchsorted(meeting_start, ends + buffer, side='left') >
+                              np.searchsorted(meeting_start, ends, side='left'))
 
-            if 12 <= slot_start.hour < 13 or 12 < slot_end.hour <= 13:
-                score -= 0.2
-                notes.append(f"[{participant_name}] Slot conflicts with lunch time avoidance preference")
+            checks['close'] = close = ending_before | starting_after
+            score[close] -= 0.1
 
-                self.logger.trace(f"{participant_name}: Lunch time conflict detected")
+        # Clamp score between 0 and 1
+        return np.clip(score, 0.0, 1.0), checks
+
+    def _build_slot_notes(
+            self,
+            participant_name: str,
+            prefs: ParticipantPreferences,
+            duration: int,
+            checks: dict[str, Any],
+            final_score: np.ndarray
+    ) -> list[list[str]]:
+        """
+        Generates the notes explaining, for each slot, how every preference of a participant is
+        respected or violated, from the check outcomes of `_calculate_slot_scores`. The messages
+        shared by many slots are formatted once per participant.
+
+        :param participant_name: The name of the participant being assessed.
+        :param prefs: The preferences of the participant.
+        :param duration: The duration of the meeting slots in minutes.
+        :param checks: The outcome of each check evaluated by `_calculate_slot_scores`.
+        :param final_score: The final suitability score of each slot.
+        :return: The explanatory notes of each slot.
+        """
+        start_hour = checks['start_hour']
+        notes: list[list[str]] = [[] for _ in range(len(start_hour))]
+
+        if 'before_violated' in checks:
+            self._append_notes(
+                notes, checks['before_violated'],
+                [f"[{participant_name}] Slot starts at {hour}:00, but prefers no meetings before {prefs.no_meetings_before}"
+                 for hour in start_hour.tolist()],
+                f"[{participant_name}] Slot respects no-meetings-before preference of {prefs.no_meetings_before}")
+
+        if 'after_violated' in checks:
+            self._append_notes(
+                notes, checks['after_violated'],
+                [f"[{participant_name}] Slot ends at {hour}:00, but prefers no meetings after {prefs.no_meetings_after}"
+                 for hour in checks['end_hour'].tolist()],
+                f"[{participant_name}] Slot respects no-meetings-after preference of {prefs.no_meetings_after}")
+
+        if 'morning' in checks:
+            self._append_notes(notes, checks['morning'],
+                               f"[{participant_name}] Slot aligns with morning preference",
+                               f"[{participant_name}] Slot does not align with morning preference")
+
+        if 'afternoon' in checks:
+            self._append_notes(notes, checks['afternoon'],
+                               f"[{participant_name}] Slot aligns with afternoon preference",
+                               f"[{participant_name}] Slot does not align with afternoon preference")
+
+        if 'lunch' in checks:
+            self._append_notes(notes, checks['lunch'],
+                               f"[{participant_name}] Slot conflicts with lunch time avoidance preference",
+                               f"[{participant_name}] Slot respects lunch time avoidance preference")
+
+        if 'duration_within' in checks:
+            if checks['duration_within']:
+                note = f"[{participant_name}] Meeting duration {duration} minutes is within preferred maximum of {prefs.preferred_max_duration} minutes"
 
             else:
-                notes.append(f"[{participant_name}] Slot respects lunch time avoidance preference")
+                note = f"[{participant_name}] Meeting duration {duration} minutes exceeds preferred maximum of {prefs.preferred_max_duration} minutes"
 
-        # Preferred duration
-        if prefs.preferred_max_duration:
+            for slot_notes in notes:
+                slot_notes.append(note)
 
-            if duration <= prefs.preferred_max_duration:
-                score += 0.1
-                notes.append(
-                    f"[{participant_name}] Meeting duration {duration} minutes is within preferred maximum of {prefs.preferred_max_duration} minutes")
+        if 'meeting_count' in checks:
+            for slot_notes, count, is_capped in zip(notes, checks['meeting_count'].tolist(), checks['capped'].tolist()):
+                if is_capped:
+                    slot_notes.append(
+                        f"[{participant_name}] Already has {count} meetings on this day, reaching maximum limit of {prefs.max_meetings_per_day}")
 
-                self.logger.trace(f"{participant_name}: Duration preference satisfied")
+                elif count >= 4:
+                    slot_notes.append(
+                        f"[{participant_name}] Already has {count} meetings on this day, which is quite busy")
 
-            else:
-                notes.append(
-                    f"[{participant_name}] Meeting duration {duration} minutes exceeds preferred maximum of {prefs.preferred_max_duration} minutes")
+                elif count >= 2:
+                    slot_notes.append(f"[{participant_name}] Already has {count} meetings on this day, moderately busy")
 
-                self.logger.trace(f"{participant_name}: Duration exceeds preference")
+                elif count == 1:
+                    slot_notes.append(f"[{participant_name}] Has {count} other meeting on this day, manageable schedule")
 
-        # Check calendar for busy periods
-        if calendar is not None and not calendar.empty:
-            slot_date = slot_start.date()
-            same_day_meetings = calendar[calendar['start_time'].dt.date == slot_date]
+                else:
+                    slot_notes.append(f"[{participant_name}] No other meetings scheduled on this day")
 
-            meeting_count = len(same_day_meetings)
+            self._append_notes(
+                notes, checks['close'],
+                f"[{participant_name}] Has meetings within {BUFFER_MINUTES} minutes of this slot, creating back-to-back scheduling",
+                f"[{participant_name}] Has adequate buffer time around this slot")
 
-            if prefs.max_meetings_per_day and meeting_count >= prefs.max_meetings_per_day:
-                score -= 0.3
-                notes.append(
-                    f"[{participant_name}] Already has {meeting_count} meetings on this day, reaching maximum limit of {prefs.max_meetings_per_day}")
+        # Add a general time assessment
+        for slot_notes, hour in zip(notes, start_hour.tolist()):
+            if 10 <= hour <= 11:
+                slot_notes.append("Time slot is in optimal mid-morning period")
 
-                self.logger.trace(f"{participant_name}: Max meetings per day reached ({meeting_count})")
+            elif 14 <= hour <= 15:
+                slot_notes.append("Time slot is in good early afternoon period")
 
-            elif meeting_count >= 4:
-                score -= 0.2
-                notes.append(
-                    f"[{participant_name}] Already has {meeting_count} meetings on this day, which is quite busy")
+            elif hour == 9:
+                slot_notes.append("Time slot is early morning")
 
-                self.logger.trace(f"{participant_name}: Has {meeting_count} meetings (quite busy)")
+            elif hour >= 16:
+                slot_notes.append("Time slot is in late afternoon")
 
-            elif meeting_count >= 2:
-                score -= 0.1
-                notes.append(f"[{participant_name}] Already has {meeting_count} meetings on this day, moderately busy")
+            elif hour < 9:
+                slot_notes.append("Time slot is very early morning")
 
-                self.logger.trace(f"{participant_name}: Has {meeting_count} meetings (moderately busy)")
+        # Add final assessment
+        for slot_notes, slot_score in zip(notes, final_score.tolist()):
+            if slot_score > 0.8:
+                slot_notes.append("Overall assessment: Excellent fit for this participant")
 
-            elif meeting_count == 1:
-                notes.append(f"[{participant_name}] Has {meeting_count} other meeting on this day, manageable schedule")
+            elif slot_score > 0.6:
+                slot_notes.append("Overall assessment: Good fit for this participant")
 
-                self.logger.trace(f"{participant_name}: Has 1 meeting (manageable)")
+            elif slot_score > 0.4:
+                slot_notes.append("Overall assessment: Acceptable fit for this participant")
 
             else:
-                notes.append(f"[{participant_name}] No other meetings scheduled on this day")
+                slot_notes.append("Overall assessment: Poor fit for this participant")
 
-                self.logger.trace(f"{participant_name}: No other meetings this day")
+        return notes
 
+    @staticmethod
+    def pack_calendar(calendar: Optional[pd.DataFrame]) -> PackedCalendar:
+        """
+        Converts the calendar of a participant to the arrays used when searching and scoring
+        slots: the meeting bounds as datetime64 values, the same bounds sorted without NaT, and
+        the number of meetings held on each day. Days are compared as datetime64[D] values, so
+        no Python date object is built for the meetings.
+
+        :param calendar: The calendar of the participant with `start_time` and `end_time` columns,
+            or None when the participant has no calendar.
+        :return: The packed calendar.
+        """
+        if calendar is None or calendar.empty:
+            empty = np.empty(0, dtype='datetime64[ns]')
 
-            # Check for meetings close to this slot
-            buffer_minutes = 15
+            return PackedCalendar(calendar, empty, empty, empty, empty,
+                                  np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.int64))
 
-            close_meetings = calendar[
-                ((calendar['end_time'] > slot_start - timedelta(minutes=buffer_minutes)) &
-                 (calendar['end_time'] <= slot_start)) |
-                ((calendar['start_time'] >= slot_end) &
-                 (calendar['start_time'] < slot_end + timedelta(minutes=buffer_minutes)))
-                ]
+        busy_start = calendar['start_time'].to_numpy(dtype='datetime64[ns]')
+        busy_end = calendar['end_time'].to_numpy(dtype='datetime64[ns]')
 
-            if not close_meetings.empty:
-                score -= 0.1
-                notes.append(
-                    f"[{participant_name}] Has meetings within {buffer_minutes} minutes of this slot, creating back-to-back scheduling")
+        start_sorted = np.sort(busy_start[~np.isnat(busy_start)])
+        end_sorted = np.sort(busy_end[~np.isnat(busy_end)])
 
-                self.logger.trace(f"{participant_name}: Has back-to-back meetings")
+        days, day_counts = np.unique(start_sorted.astype('datetime64[D]'), return_counts=True)
 
-            else:
-                notes.append(f"[{participant_name}] Has adequate buffer time around this slot")
+        return PackedCalendar(calendar, busy_start, busy_end, start_sorted, end_sorted, days, day_counts)
 
-        # Add a general time assessment
-        hour = slot_start.hour
-        if 10 <= hour <= 11:
-            notes.append("Time slot is in optimal mid-morning period")
+    def _packed_calendar(self, participant_data: dict) -> PackedCalendar:
+        """
+        Returns the packed calendar of a participant, reusing the one stored under `_packed` in
+        the participant data while it was built from the current calendar. Otherwise the calendar
+        is packed and stored there, so repeated searches with the same participant data (other
+        durations or days) only convert each calendar once.
 
-        elif 14 <= hour <= 15:
-            notes.append("Time slot is in good early afternoon period")
+        :param participant_data: The data of the participant, holding its calendar.
+        :return: The packed calendar of the participant.
+        """
+        calendar = participant_data.get('calendar')
+        packed = participant_data.get('_packed')
 
-        elif hour == 9:
-            notes.append("Time slot is early morning")
+        if packed is None or packed.calendar is not calendar:
+            packed = self.pack_calendar(calendar)
+            participant_data['_packed'] = packed
 
-        elif hour >= 16:
-            notes.append("Time slot is in late afternoon")
+        return packed
 
-        elif hour < 9:
-            notes.append("Time slot is very early morning")
+    @staticmethod
+    def _meetings_per_slot_day(packed: PackedCalendar, slot_start: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Counts the meetings held on the day of each slot, looked up in the meeting counts per
+        day of the packed calendar.
 
-        # Clamp score between 0 and 1
-        final_score = max(0.0, min(score, 1.0))
+        :param packed: The packed calendar of a participant.
+        :param slot_start: The starting times of the slots.
+        :return: The number of meetings on the day of each slot.
+        """
+        days, counts = packed.days, packed.day_counts
 
-        self.logger.trace(f"Final score for {participant_name}: {final_score:.2f}")
+        slot_days = slot_start.to_numpy().astype('datetime64[D]')
 
-        # Add final assessment
-        if final_score > 0.8:
-            notes.append("Overall assessment: Excellent fit for this participant")
+        if not len(days):
+            return np.zeros(len(slot_days), dtype=np.int64)
 
-        elif final_score > 0.6:
-            notes.append("Overall assessment: Good fit for this participant")
+        index = np.minimum(np.searchsorted(days, slot_days), len(days) - 1)
 
-        elif final_score > 0.4:
-            notes.append("Overall assessment: Acceptable fit for this participant")
+        return np.where(days[index] == slot_days, counts[index], 0)
 
-        else:
-            notes.append("Overall assessment: Poor fit for this participant")
+    @staticmethod
+    def _append_notes(
+            notes: list[list[str]],
+            condition: np.ndarray,
+            if_true: str | list[str],
+            if_false: str | list[str]
+    ) -> None:
+        """
+        Appends to the notes of each slot the message matching its outcome for a check.
+
+        :param notes: The notes of each slot, extended in place.
+        :param condition: Outcome of the check for each slot.
+        :param if_true: Message for the slots where the condition holds, either shared by all the
+            slots or one per slot.
+        :param if_false: Message for the other slots, either shared by all the slots or one per slot.
+        """
+        true_notes = if_true if isinstance(if_true, list) else repeat(if_true)
+        false_notes = if_false if isinstance(if_false, list) else repeat(if_false)
 
-        return final_score, notes
+        for slot_notes, holds, true_note, false_note in zip(notes, condition.tolist(), true_notes, false_notes):
+            slot_notes.append(true_note if holds else false_note)
 
     def _generate_slot_notes(self, slot_time: datetime, score: float) -> str:
         """Generate general explanatory notes for a time slot."""
-        self.logger.trace(f"Generating notes for slot at {slot_time.strftime('%H:%M')} with score {score:.2f}")
+        self.logger.trace("Generating notes for slot at %02d:%02d with score %.2f", slot_time.hour, slot_time.minute, score)
 
         notes = []
 
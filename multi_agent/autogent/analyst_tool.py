@@ -1,25 +1,30 @@
-import json
+import asyncio
 import logging
 from typing import Sequence, Optional
 
-import pandas as pd
 from autogen_agentchat.agents import BaseChatAgent
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import TextMessage, BaseChatMessage
 from autogen_core import CancellationToken
 
 from multi_agent.agents import ScheduleAnalystAgent
-from multi_agent.config.models import SlotInfo, MeetingSchedule
+from multi_agent.autogent.cache import TTLCache
+from multi_agent.config.models import SlotInfo, MeetingSchedule, SlotList, AnalystPayload
 from multi_agent.mock_data.calendar import get_person_calendar
 from multi_agent.mock_data.preferences import get_preference
 from multi_agent.logger.AgentLogger import AgentLogger
 
 
 class AnalystAgentAutogen(BaseChatAgent):
-    def __init__(self, name="analyst", description=None, logger: Optional[AgentLogger] = None):
+    def __init__(self, name="analyst", description=None, logger: Optional[AgentLogger] = None,
+                 max_concurrency: int = 8, participant_cache_ttl: float = 60.0):
         super().__init__(name=name, description=description)
+        self.max_concurrency = max_concurrency
+        # Participant data per participant, reused by the following negotiation rounds
+        self._participant_cache = TTLCache(maxsize=512, ttl=participant_cache_ttl)
         self.logger = logger or AgentLogger(agent_name=name)
         self.logger.info(f"Initialized {name} agent")
+        self.logger.debug("Max concurrent participant lookups: %s", max_concurrency)
 
     @property
     def produced_message_types(self):
@@ -46,34 +51,39 @@ class AnalystAgentAutogen(BaseChatAgent):
         assert isinstance(user_msg, TextMessage)
 
         self.logger.data_in("Coordinator", "Received message with meeting details", user_msg.content)
-        self.logger.debug(f"Processing message from {user_msg.source}")
+        self.logger.debug("Processing message from %s", user_msg.source)
 
         try:
-            payload = json.loads(user_msg.content)
-            participants: list[str] = payload["participants"]
-            schedule: dict = payload["schedule"]
+            payload = AnalystPayload.model_validate_json(user_msg.content)
+            participants = payload.participants
+            meeting_schedule = payload.schedule
 
             self.logger.info(f"Processing request for {len(participants)} participants")
-            self.logger.debug(f"Participants: {participants}")
-            self.logger.debug(f"Schedule: {schedule}")
+            self.logger.debug("Participants: %s", participants)
+            self.logger.debug("Schedule: %s", meeting_schedule)
+
+            participants_data = await self._load_participants_data(participants)
 
             self.logger.process_step("propose_slots", "Finding available meeting slots")
 
-            slots: list[SlotInfo] = self.propose_slots(
+            # CPU bound pandas/NumPy work, run in a worker thread so concurrent requests keep progressing
+            slots: list[SlotInfo] = await asyncio.to_thread(
+                self.propose_slots,
                 participants=participants,
-                meeting_schedule=MeetingSchedule(**schedule)
+                meeting_schedule=meeting_schedule,
+                participants_data=participants_data
             )
 
             self.logger.info(f"Found {len(slots)} potential meeting slots")
 
-            response_content = json.dumps([s.model_dump() for s in slots])
+            response_content = SlotList(slots).model_dump_json()
 
             self.logger.data_out("Coordinator", f"Returning {len(slots)} proposed slots")
 
-            if self.logger.logger.level <= logging.DEBUG:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 for i, slot in enumerate(slots[:3]):  # Just the first 3
                     self.logger.debug(
-                        f"Slot {i + 1}: {slot.start_time}-{slot.end_time} (confidence: {slot.confidence})")
+                        "Slot %d: %s-%s (confidence: %s)", i + 1, slot.start_time, slot.end_time, slot.confidence)
 
             return Response(
                 chat_message=TextMessage(
@@ -88,9 +98,69 @@ class AnalystAgentAutogen(BaseChatAgent):
 
     async def on_reset(self, cancellation_token):
         self.logger.info("Agent reset requested")
+        self._participant_cache.clear()
         return None
 
-    def propose_slots(self, participants: list[str], meeting_schedule: MeetingSchedule) -> list[SlotInfo]:
+    def _load_participant(self, participant: str) -> dict:
+        """
+        Fetch the preferences and the whole calendar of a single participant. The meeting counts
+        and buffer checks of the analyst score against the whole calendar, so it's not narrowed
+        to the schedule day. The calendar is also packed into the columnar arrays the schedule
+        analyst works on, so the conversion runs here, in the loading worker, and is kept with
+        the cached participant data.
+        """
+        preferences = get_preference(participant)
+        calendar = get_person_calendar(participant)
+
+        self.logger.debug("Loaded data for participant %s", participant)
+
+        if calendar is not None and not calendar.empty:
+            self.logger.debug("Calendar for %s has %d entries", participant, len(calendar))
+
+        return {
+            "preferences": preferences,
+            "calendar": calendar,
+            "_packed": ScheduleAnalystAgent.pack_calendar(calendar)
+        }
+
+    async def _load_participants_data(self, participants: list[str]) -> dict[str, dict]:
+        """
+        Fetches the preferences and calendars of all participants concurrently. Every lookup
+        is independent, so they are dispatched together with `asyncio.gather` and bounded by
+        a semaphore of `max_concurrency` slots to avoid flooding the data source.
+
+        The data is calculated on demand and cached once per participant, so the
+        following negotiation rounds reuse it, along with the calendar arrays the schedule
+        analyst packs into it, instead of fetching it again.
+
+        :param participants: A list of participant IDs to load.
+        :type participants: list[str]
+        :return: A dictionary mapping each participant to its "preferences" and "calendar".
+        :rtype: dict[str, dict]
+        """
+        participants_data = {p: self._participant_cache.get(p) for p in participants}
+        missing = [p for p, data in participants_data.items() if data is None]
+
+        self.logger.process_step("data_preparation",
+                                 f"Retrieving data for {len(missing)} of {len(participants_data)} participants concurrently")
+
+        if missing:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def load(participant: str) -> dict:
+                async with semaphore:
+                    return await asyncio.to_thread(self._load_participant, participant)
+
+            results = await asyncio.gather(*(load(p) for p in missing))
+
+            for participant, data in zip(missing, results):
+                self._participant_cache.set(participant, data)
+                participants_data[participant] = data
+
+        return participants_data
+
+    def propose_slots(self, participants: list[str], meeting_schedule: MeetingSchedule,
+                      participants_data: Optional[dict[str, dict]] = None) -> list[SlotInfo]:
         """
         Proposes a list of available meeting slots based on participants' calendars,
         preferences, and the meeting schedule parameters provided.
@@ -106,6 +176,9 @@ class AnalystAgentAutogen(BaseChatAgent):
         :param meeting_schedule: An object that defines scheduling parameters such as
             working hours, meeting duration, and the target scheduling day.
         :type meeting_schedule: MeetingSchedule
+        :param participants_data: Optional pre-loaded preferences and calendars keyed by
+            participant. When omitted, the data is fetched sequentially.
+        :type participants_data: Optional[dict[str, dict]]
         :return: A list of SlotInfo objects, each representing an available time slot
             that satisfies the requirements for all provided participants.
         :rtype: list[SlotInfo]
@@ -113,26 +186,13 @@ class AnalystAgentAutogen(BaseChatAgent):
 
         self.logger.process_step("propose_slots", f"Finding slots for {len(participants)} participants")
         self.logger.debug(
-            f"Meeting schedule: working hours {meeting_schedule.working_hours_start}-{meeting_schedule.working_hours_end}, duration: {meeting_schedule.default_duration}m")
-
-
-        self.logger.process_step("data_preparation", "Retrieving participant calendars and preferences")
-
-        participants_data = {}
-
-        for p in participants:
-
-            preferences = get_preference(p)
-            calendar = get_person_calendar(p)
+            "Meeting schedule: working hours %s-%s, duration: %sm", meeting_schedule.working_hours_start,
+            meeting_schedule.working_hours_end, meeting_schedule.default_duration)
 
-            participants_data[p] = {
-                "preferences": preferences,
-                "calendar": calendar
-            }
-            self.logger.debug(f"Loaded data for participant {p}")
+        if participants_data is None:
+            self.logger.process_step("data_preparation", "Retrieving participant calendars and preferences")
 
-            if calendar is not None and not calendar.empty:
-                self.logger.debug(f"Calendar for {p} has {len(calendar)} entries")
+            participants_data = {p: self._load_participant(p) for p in participants}
 
         self.logger.process_step("slot_finding", "Creating schedule analyst to find free slots")
 
@@ -143,7 +203,8 @@ class AnalystAgentAutogen(BaseChatAgent):
 
         self.logger.process_step("slot_analysis", "Finding free slots with schedule analyst")
 
-        schedule_day = pd.to_datetime(meeting_schedule.schedule_day)
+        # Already a datetime once the schedule is validated, used as is without a pandas conversion
+        schedule_day = meeting_schedule.schedule_day
 
         self.logger.info(
             f"Finding slots for {schedule_day.strftime('%Y-%m-%d')}, duration: {meeting_schedule.default_duration}m")
@@ -158,7 +219,7 @@ class AnalystAgentAutogen(BaseChatAgent):
 
         if slots:
             self.logger.debug(
-                f"Top slot: {slots[0].start_time}-{slots[0].end_time} with confidence {slots[0].confidence}")
+                "Top slot: %s-%s with confidence %s", slots[0].start_time, slots[0].end_time, slots[0].confidence)
         else:
             self.logger.warning("No available slots found")
 
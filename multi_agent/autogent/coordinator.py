@@ -1,19 +1,34 @@
+import asyncio
+import hashlib
 import json
+import logging
+import time
 from collections import Counter
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import AsyncGenerator, Optional, Sequence
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.base import Response
-from autogen_agentchat.messages import TextMessage, UserMessage, BaseChatMessage
+from autogen_agentchat.messages import TextMessage, UserMessage, BaseChatMessage, BaseAgentEvent
 from autogen_core import CancellationToken
-from autogen_core.models import SystemMessage, ChatCompletionClient
+from autogen_core.models import SystemMessage, ChatCompletionClient, LLMMessage, CreateResult
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 
 from multi_agent.autogent.analyst_tool import AnalystAgentAutogen
+from multi_agent.autogent.cache import TTLCache
 from multi_agent.autogent.negotiatior_tool import NegotiatorAgentAutogen
 from multi_agent.config.models import MeetingSchedule
 from multi_agent.logger.AgentLogger import AgentLogger
 
+# Compact separators for the payloads exchanged with the inner agents
+JSON_SEPARATORS = (",", ":")
+
+SYSTEM_MESSAGE = "You are a professional meeting scheduler providing clear, concise updates."
+
+# LLM errors worth retrying, any other failure goes straight to the fallback response
+TRANSIENT_LLM_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+MAX_RETRY_BACKOFF_SECONDS = 10.0
+
 
 class CoordinatorAgent(AssistantAgent):
     """Simple coordinator: triggers analyst → negotiator,
@@ -22,28 +37,33 @@ class CoordinatorAgent(AssistantAgent):
     def __init__(self,  model_client: ChatCompletionClient, analyst_agent: AnalystAgentAutogen,
                  negotiator_agent: NegotiatorAgentAutogen,
                  initial_meeting_schedule=MeetingSchedule(), max_negotiation_rounds=5,
-                 logger: Optional[AgentLogger] = None):
+                 logger: Optional[AgentLogger] = None, max_llm_retries: int = 2,
+                 llm_retry_backoff: float = 1.0, response_cache: Optional[TTLCache] = None):
         super().__init__(
             name="coordinator",
             model_client=model_client,
-            system_message="You are a professional meeting scheduler providing clear, concise updates."
+            system_message=SYSTEM_MESSAGE
         )
 
         self.initial_meeting_schedule = initial_meeting_schedule
         self.negotiator_agent = negotiator_agent
         self.analyst_agent = analyst_agent
         self.max_negotiation_rounds = max_negotiation_rounds
+        self.max_llm_retries = max_llm_retries
+        self.llm_retry_backoff = llm_retry_backoff
+        self.response_cache = response_cache
         self.logger = logger or AgentLogger(agent_name="Coordinator")
 
         self.logger.info("Coordinator agent initialized")
-        self.logger.debug(f"Initial meeting schedule: {initial_meeting_schedule}")
-        self.logger.debug(f"Max negotiation rounds: {max_negotiation_rounds}")
+        self.logger.debug("Initial meeting schedule: %s", initial_meeting_schedule)
+        self.logger.debug("Max negotiation rounds: %s", max_negotiation_rounds)
+        self.logger.debug("Max LLM retries: %s", max_llm_retries)
 
     def reduce_meeting_dict_for_llm(self, meeting_data: dict) -> dict:
         """
         Ultra-minimal version focusing only on the most critical information.
         """
-        selected = meeting_data.get('selected_slot', {})
+        selected = meeting_data.get('selected_slot') or {}
 
         reduced = {
             'outcome': meeting_data.get('outcome'),
@@ -58,15 +78,54 @@ class CoordinatorAgent(AssistantAgent):
             }
         }
 
-        self.logger.debug(f"Reduced meeting data: outcome={reduced['outcome']}, time={reduced['selected_time']}")
+        self.logger.debug("Reduced meeting data: outcome=%s, time=%s", reduced['outcome'], reduced['selected_time'])
 
         return reduced
 
+    @staticmethod
+    def _response_cache_key(llm_messages: Sequence[LLMMessage]) -> str:
+        """Content hash of the prompt, identical prompts share the same key."""
+        prompt = json.dumps([m.model_dump(mode="json") for m in llm_messages], sort_keys=True,
+                            separators=JSON_SEPARATORS)
+
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    async def _create_with_retry(self, llm_messages: Sequence[LLMMessage]) -> CreateResult:
+        """
+        Calls the model client, retrying with exponential backoff on transient errors
+        (connection problems, timeouts, 5xx and rate limits). Other errors are raised at once.
+
+        :param llm_messages: Messages to send to the model.
+        :type llm_messages: Sequence[LLMMessage]
+        :return: The model completion.
+        :rtype: CreateResult
+        """
+        started = time.perf_counter()
+        attempt = 0
+
+        while True:
+            try:
+                return await self._model_client.create(llm_messages)
+
+            except TRANSIENT_LLM_ERRORS as e:
+                if attempt >= self.max_llm_retries:
+                    raise
+
+                delay = min(self.llm_retry_backoff * 2 ** attempt, MAX_RETRY_BACKOFF_SECONDS)
+                attempt += 1
+
+                self.logger.warning(
+                    f"Transient LLM error ({type(e).__name__}) after {time.perf_counter() - started:.2f}s, "
+                    f"retry {attempt}/{self.max_llm_retries} in {delay:.1f}s")
+
+                await asyncio.sleep(delay)
+
     async def _generate_tailored_response(self, outcome, best_slot, participants, negotiation_rounds, history):
         """Generate a tailored response using the LLM client"""
         self.logger.process_step("generate_response", "Generating tailored response with LLM")
         self.logger.debug(
-            f"Response parameters: outcome={outcome}, participants={len(participants)}, rounds={negotiation_rounds}")
+            "Response parameters: outcome=%s, participants=%d, rounds=%s",
+            outcome, len(participants), negotiation_rounds)
 
         context = f"""
 Based on a meeting scheduling negotiation:
@@ -91,15 +150,32 @@ Keep the response professional and helpful in all cases.
 
         self.logger.debug("Sending prompt to LLM for response generation")
 
+        llm_messages = [
+            SystemMessage(content=SYSTEM_MESSAGE),
+            UserMessage(content=context, source="coordinator")
+        ]
+
+        # Identical prompts get the same answer from a deterministic model, serve them from the cache
+        cache_key = None
+
+        if self.response_cache is not None:
+            cache_key = self._response_cache_key(llm_messages)
+            cached = self.response_cache.get(cache_key)
+
+            if cached is not None:
+                self.logger.debug("Serving response from the LLM response cache")
+
+                return cached
+
         # Use the model client to generate a tailored response
         try:
-            response = await self._model_client.create([
-                SystemMessage(content="You are a professional meeting scheduler providing clear, concise updates."),
-                UserMessage(content=context, source="coordinator")
-            ])
+            response = await self._create_with_retry(llm_messages)
 
             self.logger.debug("Received response from LLM")
 
+            if cache_key is not None:
+                self.response_cache.set(cache_key, response.content)
+
             return response.content
 
         except Exception as e:
@@ -115,6 +191,43 @@ Keep the response professional and helpful in all cases.
             else:
                 return "Unable to schedule a meeting with the current constraints. Please consider extending the timeframe or adjusting preferences."
 
+    async def _trivial_schedule(self, participants: list[str], participants_json: str,
+                                schedule: MeetingSchedule) -> tuple[str, list[BaseChatMessage]]:
+        """
+        Builds the response for requests with at most one participant. A single participant
+        gets the best slot proposed by the analyst, the negotiator and the LLM are not involved.
+
+        :param participants: The participants of the request, at most one.
+        :type participants: list[str]
+        :param participants_json: The participants serialized for the analyst payload.
+        :type participants_json: str
+        :param schedule: The meeting schedule to search.
+        :type schedule: MeetingSchedule
+        :return: The response text and the analyst messages.
+        :rtype: tuple[str, list[BaseChatMessage]]
+        """
+        if not participants:
+            self.logger.warning("No participants given, nothing to schedule")
+
+            return "No participants were given, so there is no meeting to schedule.", []
+
+        schedule_json = schedule.model_dump_json()
+        analyst_result = await self.analyst_agent.run(
+            task=f'{{"participants":{participants_json},"schedule":{schedule_json}}}')
+
+        slots = json.loads(analyst_result.messages[-1].content)
+
+        self.logger.data_in("AnalystAgent", f"Received {len(slots)} available slots")
+
+        if not slots:
+            return (f"{participants[0]} has no free slot on {schedule.schedule_day.date().isoformat()}. "
+                    f"Please consider another day."), [analyst_result.messages[-1]]
+
+        best_slot = slots[0]
+
+        return (f"Meeting scheduled for {best_slot['start_time']} - {best_slot['end_time']} "
+                f"with {participants[0]}."), [analyst_result.messages[-1]]
+
     async def on_messages(
             self,
             messages: Sequence[BaseChatMessage],
@@ -133,6 +246,29 @@ Keep the response professional and helpful in all cases.
             negotiations, and the total number of negotiation rounds.
         :rtype: Response
         """
+        async for message in self.on_messages_stream(messages, cancellation_token):
+            if isinstance(message, Response):
+                return message
+
+        raise AssertionError("The stream should have returned the final result.")
+
+    async def on_messages_stream(
+            self,
+            messages: Sequence[BaseChatMessage],
+            cancellation_token: CancellationToken,
+    ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
+        """
+        Streaming variant of `on_messages`. Yields the analyst and negotiator messages as soon as
+        each negotiation round produces them, followed by the final Response, so callers using
+        `run_stream` can render progress before the whole negotiation completes.
+
+        :param messages: List of TextMessage objects where the last message contains the "participants" list.
+        :type messages: list
+        :param cancellation_token: Token that allows the ongoing async process to be cancelled.
+        :type cancellation_token: Any
+        :return: An async generator of the inner agent messages, ending with the final Response.
+        :rtype: AsyncGenerator
+        """
         self.logger.process_step("on_messages", "Starting coordination process")
 
         # Expect the first user TextMessage to contain "participants" list.
@@ -149,13 +285,14 @@ Keep the response professional and helpful in all cases.
 
             schedule = self.initial_meeting_schedule
 
-            self.logger.debug(f"Initial schedule: {schedule}")
+            self.logger.debug("Initial schedule: %s", schedule)
 
             if 'schedule_date' in payload:
                 try:
-                    self.logger.debug(f"Parsing schedule date: {payload['schedule_date']}")
+                    self.logger.debug("Parsing schedule date: %s", payload['schedule_date'])
 
-                    schedule.schedule_day = datetime.strptime(payload['schedule_date'], '%Y-%m-%d')
+                    schedule = schedule.model_copy(
+                        update={'schedule_day': datetime.strptime(payload['schedule_date'], '%Y-%m-%d')})
 
                     self.logger.info(f"Set schedule day to {schedule.schedule_day}")
                 except ValueError as e:
@@ -163,31 +300,65 @@ Keep the response professional and helpful in all cases.
 
                     self.logger.error(error_msg)
 
-                    return Response(
+                    yield Response(
                         chat_message=TextMessage(
                             source=self.name,
                             content=error_msg
                         ))
+
+                    return
                 except Exception as e:
                     error_msg = f"Error processing schedule date: {str(e)}"
 
                     self.logger.error(error_msg, exc_info=True)
 
-                    return Response(
+                    yield Response(
                         chat_message=TextMessage(
                             source=self.name,
                             content=error_msg
                         ))
 
+                    return
+
+            # Serialized once and spliced into every inner agent payload
+            participants_json = json.dumps(participants, separators=JSON_SEPARATORS)
+
+            # Nothing to negotiate with one participant or none, answer without negotiation or LLM
+            if len(participants) <= 1:
+                self.logger.decision("short_circuit", "Skipping negotiation and LLM response",
+                                     f"{len(participants)} participant(s), nothing to negotiate")
+
+                content, inner_messages = await self._trivial_schedule(participants, participants_json, schedule)
+
+                for message in inner_messages:
+                    yield message
+
+                self.logger.data_out("User", "Sending final scheduling response")
+
+                yield Response(
+                    chat_message=TextMessage(
+                        source=self.name,
+                        content=content
+                    ),
+                    inner_messages=inner_messages
+                )
+
+                return
+
             negotiation_history = []
             round_num = 0
             optimal_found = False
             best_slot = None
             all_suggestions = []
             inner_messages = []
+            # Analyst answer for each serialized schedule, a schedule seen again reuses its slots
+            analyst_messages: dict[str, BaseChatMessage] = {}
 
             self.logger.process_step("negotiation_loop", "Starting negotiation rounds")
 
+            # Serialized again only when a round changes the schedule
+            schedule_json = schedule.model_dump_json()
+
             while round_num < self.max_negotiation_rounds and not optimal_found:
 
                 self.logger.info(f"{'-' * 80}")
@@ -198,33 +369,38 @@ Keep the response professional and helpful in all cases.
                 # Call Analyst
                 self.logger.process_step("analyst_call", "Requesting available slots from analyst")
 
-                analyst_payload = json.dumps({
-                    'participants': participants,
-                    'schedule': schedule.model_dump()
-                })
+                analyst_message = analyst_messages.get(schedule_json)
+
+                if analyst_message is None:
+                    analyst_payload = f'{{"participants":{participants_json},"schedule":{schedule_json}}}'
 
-                self.logger.data_out("AnalystAgent", "Sending request for available slots")
+                    self.logger.data_out("AnalystAgent", "Sending request for available slots")
+
+                    analyst_result = await self.analyst_agent.run(task=analyst_payload)
+                    analyst_message = analyst_messages[schedule_json] = analyst_result.messages[-1]
+                else:
+                    self.logger.debug("Schedule already analysed in an earlier round, reusing its slots")
 
-                analyst_result = await self.analyst_agent.run(task=analyst_payload)
-                inner_messages.append(analyst_result.messages[-1])
+                inner_messages.append(analyst_message)
+                yield analyst_message
 
-                slots = json.loads(analyst_result.messages[-1].content)
+                slots_json = analyst_message.content
+                slots = json.loads(slots_json)
 
                 self.logger.data_in("AnalystAgent", f"Received {len(slots)} available slots")
-                self.logger.debug(f"First slot (if available): {slots[0] if slots else 'No slots'}")
+                self.logger.debug("First slot (if available): %s", slots[0] if slots else 'No slots')
 
                 # Call Negotiator
                 self.logger.process_step("negotiator_call", "Requesting negotiation for slots")
 
-                negotiator_prompt = json.dumps({
-                    "slots": slots,
-                    "participants": participants,
-                    "schedule": schedule.model_dump()
-                })
+                # Reuse the analyst output and the serialized participants/schedule as-is
+                negotiator_prompt = (f'{{"slots":{slots_json},"participants":{participants_json},'
+                                     f'"schedule":{schedule_json}}}')
                 self.logger.data_out("NegotiatorAgent", "Sending slots for negotiation")
 
                 neg_result = await self.negotiator_agent.run(task=negotiator_prompt)
                 inner_messages.append(neg_result.messages[-1])
+                yield neg_result.messages[-1]
 
                 negotiation = json.loads(neg_result.messages[-1].content)
 
@@ -233,13 +409,14 @@ Keep the response professional and helpful in all cases.
 
                 negotiation_history.append(negotiation)
 
-                self.logger.debug(f"Negotiation round {round_num + 1} outcome: {negotiation.get('outcome')}")
+                self.logger.debug("Negotiation round %d outcome: %s", round_num + 1, negotiation.get('outcome'))
 
                 if 'selected_slot' in negotiation and negotiation['selected_slot'] is not None:
                     all_suggestions.append(negotiation['selected_slot'])
 
                     self.logger.debug(
-                        f"Selected slot: {negotiation['selected_slot'].get('start_time')}-{negotiation['selected_slot'].get('end_time')}")
+                        "Selected slot: %s-%s", negotiation['selected_slot'].get('start_time'),
+                        negotiation['selected_slot'].get('end_time'))
 
                 # Collect all alternative suggestions
                 suggestions = negotiation.get("alternative_suggestions", [])
@@ -247,7 +424,7 @@ Keep the response professional and helpful in all cases.
                 if suggestions:
                     all_suggestions.extend(suggestions)
 
-                    self.logger.debug(f"Added {len(suggestions)} alternative suggestions")
+                    self.logger.debug("Added %d alternative suggestions", len(suggestions))
 
                 if negotiation.get("outcome") == 'optimal_found':
                     self.logger.decision("negotiation_outcome", "Optimal slot found, ending negotiation",
@@ -260,9 +437,33 @@ Keep the response professional and helpful in all cases.
 
                 self.logger.process_step("schedule_update", "Updating schedule for next round")
 
-                schedule = MeetingSchedule(**negotiation.get('proposed_schedule'))
+                proposed_schedule = negotiation.get('proposed_schedule')
+
+                # No schedule to try next, the negotiation found the request impossible
+                if proposed_schedule is None:
+                    self.logger.decision("negotiation_outcome", "No schedule proposed, ending negotiation",
+                                         f"Round {round_num + 1} returned outcome {negotiation.get('outcome')}")
+
+                    round_num += 1
+
+                    break
+
+                proposed_schedule = MeetingSchedule.model_validate(proposed_schedule)
+
+                # The analyst and the negotiator keep no state between rounds, so given the same
+                # schedule again every following round would repeat this one
+                if proposed_schedule == schedule:
+                    self.logger.decision("negotiation_outcome", "Schedule unchanged, ending negotiation",
+                                         f"Round {round_num + 1} proposed the schedule it was given")
+
+                    round_num += 1
+
+                    break
+
+                schedule = proposed_schedule
+                schedule_json = schedule.model_dump_json()
 
-                self.logger.debug(f"Updated schedule: {schedule}")
+                self.logger.debug("Updated schedule: %s", schedule)
 
                 round_num += 1
 
@@ -271,29 +472,27 @@ Keep the response professional and helpful in all cases.
                 self.logger.process_step("fallback_selection", "No optimal solution found, selecting best alternative")
 
                 if all_suggestions:
-                    self.logger.debug(f"Selecting from {len(all_suggestions)} collected suggestions")
-
-                    # Convert dictionaries to JSON strings for counting
-                    suggestion_strings = [json.dumps(suggestion, sort_keys=True) for suggestion in all_suggestions]
-
-                    # Find the most common suggestion
+                    self.logger.debug("Selecting from %d collected suggestions", len(all_suggestions))
 
-                    most_common_json, count = Counter(suggestion_strings).most_common(1)[0]
-                    most_common = json.loads(most_common_json)
+                    # The most common suggestion can never have a higher confidence than the most
+                    # confident one, so the comparison always settles on the latter: a single max pass
+                    # picks it (the first one on ties, as the stable sort did) and the frequencies are
+                    # only counted for the debug log
+                    highest_confidence = max(all_suggestions, key=lambda x: x['confidence'])
 
-                    self.logger.debug(f"Most common suggestion appeared {count} times")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        _, count = Counter(json.dumps(suggestion, sort_keys=True, separators=JSON_SEPARATORS)
+                                           for suggestion in all_suggestions).most_common(1)[0]
 
-                    confidence_sorted = sorted(all_suggestions, key=lambda x: x['confidence'], reverse=True)
-                    highest_confidence = confidence_sorted[0]
+                        self.logger.debug("Most common suggestion appeared %d times", count)
 
-                    self.logger.debug(f"Highest confidence suggestion: {highest_confidence['confidence']}")
+                    self.logger.debug("Highest confidence suggestion: %s", highest_confidence['confidence'])
 
-                    best_slot = most_common if most_common['confidence'] > highest_confidence[
-                        'confidence'] else highest_confidence
+                    best_slot = highest_confidence
 
                     self.logger.decision("fallback_selection",
                                          f"Selected slot with confidence {best_slot['confidence']}",
-                                         "Used frequency/confidence comparison")
+                                         "Highest-confidence suggestion")
                 else:
                     self.logger.warning("No suggestions available, unable to select a slot")
 
@@ -315,7 +514,7 @@ Keep the response professional and helpful in all cases.
 
             self.logger.data_out("User", "Sending final scheduling response")
 
-            return Response(
+            yield Response(
                 chat_message=TextMessage(
                     source=self.name,
                     content=tailored_response
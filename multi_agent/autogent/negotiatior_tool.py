@@ -1,4 +1,4 @@
-import json
+import asyncio
 import logging
 from typing import Sequence, Optional
 
@@ -8,18 +8,25 @@ from autogen_agentchat.messages import TextMessage, BaseChatMessage
 from autogen_core import CancellationToken
 
 from multi_agent.agents import NegotiationSpecialistAgent
-from multi_agent.config.models import NegotiationResult, SlotInfo, MeetingSchedule, NegotiationStrategy
-from multi_agent.mock_data.calendar import get_person_calendar
-from multi_agent.mock_data.preferences import get_preference
+from multi_agent.autogent.cache import TTLCache
+from multi_agent.config.models import NegotiationResult, SlotInfo, MeetingSchedule, NegotiationStrategy, \
+    NegotiatorPayload, PreviousNegotiation
+from multi_agent.mock_data.calendar import get_person_calendars
+from multi_agent.mock_data.preferences import get_preferences
 from multi_agent.logger.AgentLogger import AgentLogger
 
 
 class NegotiatorAgentAutogen(BaseChatAgent):
-    def __init__(self, name="negotiator", description=None, logger: Optional[AgentLogger] = None):
+    def __init__(self, name="negotiator", description=None, logger: Optional[AgentLogger] = None,
+                 participant_cache_ttl: float = 60.0):
         super().__init__(name=name, description=description)
+        # Participant data, reused by the following negotiation rounds
+        self._participant_cache = TTLCache(maxsize=512, ttl=participant_cache_ttl)
+        # Negotiation specialist of the latest schedule, reused while the rounds keep the same schedule
+        self._specialist: Optional[NegotiationSpecialistAgent] = None
 
-        self.logger = logger or AgentLogger(agent_name=name)
-        self.logger.info(f"Initialized {name} agent")
+        self.logger = logger if logger is not None else AgentLogger.get_or_create(name)
+        self.logger.info("Initialized %s agent", name)
 
     @property
     def produced_message_types(self):
@@ -48,16 +55,18 @@ class NegotiatorAgentAutogen(BaseChatAgent):
 
         self.logger.data_in("Coordinator", "Received message for negotiation", user_msg.content)
 
-        # Find previous negotiator messages to determine strategy progression
-        negotiators = [msg for msg in messages if msg.source == 'negotiator']
+        # Find the latest negotiator message to determine strategy progression
+        last_negotiator = next((msg for msg in reversed(messages) if msg.source == 'negotiator'), None)
 
-        if negotiators:
-            self.logger.debug(f"Found {len(negotiators)} previous negotiator messages")
+        if last_negotiator is not None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Found %d previous negotiator messages",
+                                  sum(1 for msg in messages if msg.source == 'negotiator'))
 
-            previous_result = json.loads(negotiators[-1].content)
-            previous_strategy = NegotiationResult(**previous_result).strategy_choose
+            # Only the strategy is needed, the slots and schedule of the previous result are skipped
+            previous_strategy = PreviousNegotiation.model_validate_json(last_negotiator.content).strategy_choose
 
-            self.logger.info(f"Previous negotiation strategy: {previous_strategy}")
+            self.logger.info("Previous negotiation strategy: %s", previous_strategy)
 
         else:
             self.logger.info("No previous negotiation strategy found, starting with NONE")
@@ -67,18 +76,21 @@ class NegotiatorAgentAutogen(BaseChatAgent):
         assert isinstance(user_msg, TextMessage)
 
         try:
-            payload = json.loads(user_msg.content)
+            payload = NegotiatorPayload.model_validate_json(user_msg.content)
 
-            self.logger.debug(f"Received payload with {len(payload.get('slots', []))} slots for negotiation")
+            self.logger.debug("Received payload with %d slots for negotiation", len(payload.slots))
+
+            participants_data = await self._load_participants_data(payload.participants)
 
             self.logger.process_step("negotiate_slots", "Starting negotiation process")
 
             negotiation: NegotiationResult = self.negotiate_slots(
-                slots=[SlotInfo(**s) for s in payload["slots"]],
-                participants=payload["participants"],
-                schedule=payload["schedule"],
+                slots=payload.slots,
+                participants=payload.participants,
+                schedule=payload.schedule,
                 min_score=0.6,
-                previous_strategy=previous_strategy
+                previous_strategy=previous_strategy,
+                participants_data=participants_data
             )
 
             self.logger.decision("negotiation_outcome",
@@ -101,13 +113,59 @@ class NegotiatorAgentAutogen(BaseChatAgent):
 
     async def on_reset(self, cancellation_token):
         self.logger.info("Agent reset requested")
+        self._participant_cache.clear()
+        self._specialist = None
         return None
 
+    def _load_participants(self, participants: list[str]) -> dict[str, dict]:
+        """Fetch the preferences and the full calendars of the participants with one bulk lookup each."""
+        preferences = get_preferences(participants)
+        calendars = get_person_calendars(participants)
+
+        self.logger.debug("Loaded data for participants %s", participants)
+
+        return {
+            p: {
+                "preferences": preferences[p],
+                "calendar": calendars[p]
+            }
+            for p in participants
+        }
+
+    async def _load_participants_data(self, participants: list[str]) -> dict[str, dict]:
+        """
+        Fetches the preferences and calendars of all participants with a single bulk lookup,
+        run in a worker thread so the event loop is not blocked.
+
+        The data is calculated on demand and cached once per participant, so the following
+        negotiation rounds reuse it instead of fetching it again.
+
+        :param participants: A list of participant IDs to load.
+        :type participants: list[str]
+        :return: A dictionary mapping each participant to its "preferences" and "calendar".
+        :rtype: dict[str, dict]
+        """
+        participants_data = {p: self._participant_cache.get(p) for p in participants}
+        missing = [p for p, data in participants_data.items() if data is None]
+
+        self.logger.process_step("data_preparation",
+                                 f"Retrieving data for {len(missing)} of {len(participants_data)} participants")
+
+        if missing:
+            loaded = await asyncio.to_thread(self._load_participants, missing)
+
+            for participant, data in loaded.items():
+                self._participant_cache.set(participant, data)
+                participants_data[participant] = data
+
+        return participants_data
+
     def negotiate_slots(self, slots: list[SlotInfo],
                         participants: list[str],
-                        schedule: dict,
+                        schedule: dict | MeetingSchedule,
                         min_score: float = 0.60,
-                        previous_strategy: NegotiationStrategy = NegotiationStrategy.NONE) -> NegotiationResult:
+                        previous_strategy: NegotiationStrategy = NegotiationStrategy.NONE,
+                        participants_data: Optional[dict[str, dict]] = None) -> NegotiationResult:
         """
         Executes a negotiation process to determine the optimal schedule for meeting slots
         based on the provided available slots, participants' preferences, and a given minimum
@@ -118,52 +176,49 @@ class NegotiatorAgentAutogen(BaseChatAgent):
                       time slot for the meeting negotiation process.
         :param participants: A list of participant names whose individual preferences
                              and calendars will be included in the negotiation.
-        :param schedule: A dictionary representing the initial meeting schedule before
-                         the negotiation process begins.
+        :param schedule: The initial meeting schedule before the negotiation process begins,
+                         either a MeetingSchedule or its dictionary representation.
         :param min_score: Optional; A float value representing the minimum required score
                           that a schedule must achieve to be considered acceptable.
         :param previous_strategy: Optional; A NegotiationStrategy enum specifying the
                                   previous negotiation strategy to be taken into account.
+        :param participants_data: Optional; pre-loaded preferences and calendars keyed by
+                                  participant. When omitted, the data is fetched here.
         :return: Returns a NegotiationResult object encapsulating the negotiation outcome,
                  which includes the finalized schedule and meeting details.
         """
         self.logger.process_step("negotiate_slots",
                                  f"Negotiating {len(slots)} slots for {len(participants)} participants with strategy {previous_strategy}")
 
-        self.logger.info(f"Min score: {min_score}, Previous strategy: {previous_strategy}")
+        self.logger.info("Min score: %s, Previous strategy: %s", min_score, previous_strategy)
 
         if slots:
             slot_info = slots[0]
 
             self.logger.debug(
-                f"First slot example: {slot_info.start_time}-{slot_info.end_time}, confidence: {slot_info.confidence}")
+                "First slot example: %s-%s, confidence: %s",
+                slot_info.start_time, slot_info.end_time, slot_info.confidence)
 
         # convert participants dict back to {name: {"preferences": Pydantic, "calendar": df}}
-        self.logger.process_step("data_preparation", "Loading participant data for negotiation")
-
-        participants_data = {}
-
-        for p in participants:
-            preferences = get_preference(p)
-            calendar = get_person_calendar(p)
+        if participants_data is None:
+            self.logger.process_step("data_preparation", "Loading participant data for negotiation")
 
-            participants_data[p] = {
-                "preferences": preferences,
-                "calendar": calendar
-            }
-
-            self.logger.debug(f"Loaded data for participant {p}")
+            participants_data = self._load_participants(participants)
 
         self.logger.process_step("create_negotiator", "Creating negotiation specialist")
 
-        meeting_schedule = MeetingSchedule(**schedule)
+        meeting_schedule = MeetingSchedule.model_validate(schedule)
 
         self.logger.debug(
-            f"Meeting schedule: day {meeting_schedule.schedule_day}, duration: {meeting_schedule.default_duration}m")
+            "Meeting schedule: day %s, duration: %sm", meeting_schedule.schedule_day, meeting_schedule.default_duration)
 
-        negotiator = NegotiationSpecialistAgent(
-            initial_schedule=meeting_schedule
-        )
+        # The specialist only holds the (immutable) schedule, so it's rebuilt only when the schedule changes
+        if self._specialist is None or self._specialist.initial != meeting_schedule:
+            self._specialist = NegotiationSpecialistAgent(
+                initial_schedule=meeting_schedule
+            )
+
+        negotiator = self._specialist
 
         self.logger.process_step("run_negotiation", "Running negotiation process")
 
@@ -179,12 +234,12 @@ class NegotiatorAgentAutogen(BaseChatAgent):
                              f"Strategy used: {result.strategy_choose}, Reasoning: {result.reasoning}")
 
         if result.selected_slot:
-            self.logger.info(f"Selected slot: {result.selected_slot.start_time}-{result.selected_slot.end_time}")
-            self.logger.debug(f"Selected slot confidence: {result.selected_slot.confidence}")
+            self.logger.info("Selected slot: %s-%s", result.selected_slot.start_time, result.selected_slot.end_time)
+            self.logger.debug("Selected slot confidence: %s", result.selected_slot.confidence)
 
         else:
             self.logger.warning("No slot was selected during negotiation")
 
-        self.logger.info(f"Alternative suggestions: {len(result.alternative_suggestions)}")
+        self.logger.info("Alternative suggestions: %d", len(result.alternative_suggestions))
 
         return result
\ No newline at end of file
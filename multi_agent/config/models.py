@@ -1,10 +1,16 @@
+import re
 from datetime import datetime, time
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Union, Any, Literal, Callable
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, RootModel
 from pydantic.main import IncEx
 
+# 24-hour times accepted by the validators, "HH:MM" and a bare "HH"
+_HHMM = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+_HH = re.compile(r'^([01]?[0-9]|2[0-3])$')
+
 
 def int_to_time_str(val: int) -> str:
     if 0 <= val <= 23:
@@ -12,7 +18,18 @@ def int_to_time_str(val: int) -> str:
     raise ValueError("Hour integer must be between 0 and 23.")
 
 
+@lru_cache(maxsize=256)
+def _minutes_since_midnight(val: Optional[str]) -> Optional[int]:
+    if not val:
+        return None
+    hours, _, minutes = val.partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
 class ParticipantPreferences(BaseModel):
+    # Immutable, the loaded preferences are shared by every agent and negotiation round
+    model_config = ConfigDict(frozen=True)
+
     no_meetings_before: Optional[Union[str, int]] = Field(
         None, description="24-hour format string (e.g., '10:00') or int (e.g., 10)"
     )
@@ -31,6 +48,16 @@ class ParticipantPreferences(BaseModel):
     def no_after(self) -> time:
         return time.fromisoformat(self.no_meetings_after)
 
+    @property
+    def no_before_min(self) -> Optional[int]:
+        """`no_meetings_before` in minutes since midnight, parsed once per distinct value."""
+        return _minutes_since_midnight(self.no_meetings_before)
+
+    @property
+    def no_after_min(self) -> Optional[int]:
+        """`no_meetings_after` in minutes since midnight, parsed once per distinct value."""
+        return _minutes_since_midnight(self.no_meetings_after)
+
     @field_validator('no_meetings_before', 'no_meetings_after', mode='before')
     @classmethod
     def normalize_time(cls, v):
@@ -39,16 +66,18 @@ class ParticipantPreferences(BaseModel):
         if isinstance(v, int):
             return int_to_time_str(v)
         if isinstance(v, str):
-            import re
-            if re.match(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$', v):
+            if _HHMM.match(v):
                 return v
-            if re.match(r'^([01]?[0-9]|2[0-3])$', v):
+            if _HH.match(v):
                 return '0' + v if len(v) == 1 else v + ':00'
             raise ValueError('Time string must be in 24-hour format (HH:MM)')
         raise ValueError('Value must be int (0-23) or string in 24-hour format (HH:MM)')
 
 
 class MeetingSchedule(BaseModel):
+    # Immutable, every change goes through model_copy so a schedule can be shared safely
+    model_config = ConfigDict(frozen=True)
+
     schedule_day: datetime = Field(
         default_factory=datetime.now,
         description="Day of the meeting"
@@ -119,14 +148,15 @@ class MeetingSchedule(BaseModel):
         if isinstance(v, int):
             return int_to_time_str(v)
         if isinstance(v, str):
-            import re
-            if re.match(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$', v):
+            if _HHMM.match(v):
                 return v
             raise ValueError('Time string must be in 24-hour format (HH:MM)')
         raise ValueError('Value must be int (0-23) or string in 24-hour format (HH:MM)')
 
 
 class SlotInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start_time: str = Field(..., description="Start time in YYYY-MM-DD HH:MM format")
     end_time: str = Field(..., description="End time in YYYY-MM-DD HH:MM format")
     duration_minutes: int = Field(..., gt=0, description="Duration in minutes")
@@ -139,6 +169,24 @@ class SlotInfo(BaseModel):
     score: float = Field(default=0.0, description="Average score for the slot")
 
 
+class SlotList(RootModel[list[SlotInfo]]):
+    """Slots exchanged between the analyst and the negotiator, (de)serialized in a single pydantic-core pass."""
+    root: list[SlotInfo]
+
+
+class AnalystPayload(BaseModel):
+    """Request sent by the coordinator to the analyst, parsed in a single pydantic-core pass."""
+    participants: list[str]
+    schedule: MeetingSchedule
+
+
+class NegotiatorPayload(BaseModel):
+    """Request sent by the coordinator to the negotiator, parsed in a single pydantic-core pass."""
+    slots: list[SlotInfo]
+    participants: list[str]
+    schedule: MeetingSchedule
+
+
 class NegotiationOutcome(str, Enum):
     OPTIMAL_FOUND = "optimal_found"
     COMPROMISE_PROPOSED = "compromise_proposed"
@@ -161,3 +209,10 @@ class NegotiationResult(BaseModel):
     strategy_choose: NegotiationStrategy = Field(NegotiationStrategy.NONE, description='Strategy choose in negotiation')
 
     model_config = ConfigDict(use_enum_values=True)
+
+
+class PreviousNegotiation(BaseModel):
+    """Strategy of an earlier negotiation result, read without validating the rest of the result."""
+    strategy_choose: NegotiationStrategy = Field(NegotiationStrategy.NONE, description='Strategy choose in negotiation')
+
+    model_config = ConfigDict(use_enum_values=True)
@@ -1,21 +1,77 @@
 
+import atexit
 import logging
 import os
+import queue
 import sys
+import weakref
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 
 # Define log levels with custom names for better visibility in agent system
 TRACE = 5  # More detailed than DEBUG
 logging.addLevelName(TRACE, "TRACE")
 
+
+class _AgentHandlers(logging.Handler):
+    """Routes a queued record to the handlers of the agent that logged it."""
+
+    def __init__(self):
+        super().__init__()
+        self.by_agent: dict[str, list[logging.Handler]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for handler in self.by_agent.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter reusing the formatted timestamp while records are created within the same second."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time: tuple[int, str] = (-1, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        last_second, formatted = self._last_time
+
+        if second != last_second:
+            formatted = super().formatTime(record, datefmt)
+            self._last_time = (second, formatted)
+
+        return formatted
+
+
+# Format shared by the console and file output of every agent, the date format has a one second resolution
+_formatter = _SecondCachedFormatter(
+    '%(asctime)s \t %(name)s \t %(levelname)s \t %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_formatter)
+
+# Agents only enqueue their records, the console and file I/O of every agent happens on a single
+# background thread so logging never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_agent_handlers = _AgentHandlers()
+_queue_handler = QueueHandler(_log_queue)
+_listener = QueueListener(_log_queue, _agent_handlers)
+_listener.start()
+atexit.register(_listener.stop)
+
+
 class AgentLogger:
     """
     Centralized logger for the multi-agent system that tracks data flow between agents.
     Provides consistent logging format and multiple output options.
     """
 
+    # Live loggers by agent name, the latest one built for each name, handed out by `get_or_create`
+    _instances: "weakref.WeakValueDictionary[str, AgentLogger]" = weakref.WeakValueDictionary()
+
     def __init__(
             self,
             agent_name: str,
@@ -43,18 +99,12 @@ class AgentLogger:
         # Clear any existing handlers
         if self.logger.handlers:
             self.logger.handlers.clear()
-            
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s \t %(name)s \t %(levelname)s \t %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
+
+        handlers = []
+
         # Add console handler if requested
         if console_output:
-            console = logging.StreamHandler(sys.stdout)
-            console.setFormatter(formatter)
-            self.logger.addHandler(console)
+            handlers.append(_console_handler)
             
         # Add file handler if specified
         if log_file:
@@ -68,26 +118,52 @@ class AgentLogger:
                 backupCount=backup_count,
                 delay=True  # Only create the file when first record is emitted
             )
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            file_handler.setFormatter(_formatter)
+            handlers.append(file_handler)
+
+        # The handlers run on the listener thread, the logger itself only feeds the shared queue
+        if handlers:
+            _agent_handlers.by_agent[agent_name] = handlers
+            self.logger.addHandler(_queue_handler)
+
+        AgentLogger._instances[agent_name] = self
+
+    @classmethod
+    def get_or_create(cls, agent_name: str, **kwargs) -> "AgentLogger":
+        """
+        Return the live logger of `agent_name`, creating it with `kwargs` if there is none.
+        Agents built without an explicit logger share it instead of setting up the handlers
+        of the underlying logger again on every construction.
+        """
+        logger = cls._instances.get(agent_name)
+
+        if logger is None:
+            logger = cls(agent_name, **kwargs)
+
+        return logger
 
     def trace(self, msg, *args, **kwargs):
         """Log detailed trace information (more granular than debug)"""
         self.logger.log(TRACE, msg, *args, **kwargs)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether a message of `level` would be emitted, to guard costly log arguments"""
+        return self.logger.isEnabledFor(level)
         
     def data_in(self, data_source: str, data_description: str, data=None):
         """Log data coming into the agent"""
-        msg = f"DATA IN from {data_source}: {data_description}"
-        if data is not None and self.logger.level <= logging.DEBUG:
-            msg += f"\n{data}"
-        self.logger.info(msg)
+        # Formatted only when emitted, the payload itself only at DEBUG level
+        if data is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.info("DATA IN from %s: %s\n%s", data_source, data_description, data)
+        else:
+            self.logger.info("DATA IN from %s: %s", data_source, data_description)
         
     def data_out(self, data_target: str, data_description: str, data=None):
         """Log data going out from the agent"""
-        msg = f"DATA OUT to {data_target}: {data_description}"
-        if data is not None and self.logger.level <= logging.DEBUG:
-            msg += f"\n{data}"
-        self.logger.info(msg)
+        if data is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.info("DATA OUT to %s: %s\n%s", data_target, data_description, data)
+        else:
+            self.logger.info("DATA OUT to %s: %s", data_target, data_description)
         
     def process_step(self, step_name: str, description: str):
         """Log a processing step within the agent"""
@@ -2,12 +2,18 @@ import asyncio
 import json
 import os
 import logging
+import sys
+import time
+import weakref
+from typing import Optional
 
+from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import TextMessage
-from autogen_core.models import ModelFamily
+from autogen_core.models import ModelFamily, UserMessage
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from multi_agent.autogent.analyst_tool import AnalystAgentAutogen
+from multi_agent.autogent.cache import TTLCache
 from multi_agent.autogent.coordinator import CoordinatorAgent
 from multi_agent.autogent.negotiatior_tool import NegotiatorAgentAutogen
 from multi_agent.config.models import MeetingSchedule
@@ -18,10 +24,25 @@ from multi_agent.logger.AgentLogger import AgentLogger, get_system_logger
 MODEL_BASE_URL = "http://127.0.0.1:1234/v1"
 MODEL_NAME = "mistral-nemo-instruct-2407"
 API_KEY = 'not-use'
+MODEL_MAX_TOKENS = 512 # Ceiling on the tokens generated for the final summary
+MODEL_TEMPERATURE = 0
+HTTP_TIMEOUT = 60.0 # Seconds, per request to the LLM server
 MAX_PARTICIPANTS = 3
 SCHEDULE_DATE = '2025-07-22'
-PARTICIPANTS = get_random_participants(max_number=MAX_PARTICIPANTS) # Random list of participants, based on mock data
+PARTICIPANTS: Optional[list[str]] = None # Fixed list of participants, a random sample of the mock data when None
 MAX_NEGOTIATION_ROUNDS = 5
+MAX_CONCURRENCY = 4 # Max participant lookups dispatched concurrently by the analyst
+BATCH_MAX_CONCURRENCY = 8 # Max scheduling jobs run concurrently by schedule_meeting_batch
+PREWARM_MODEL = False # Ping the LLM before a single-shot run so the model load overlaps agent setup
+RESPONSE_CACHE_TTL = 300 # Seconds identical LLM prompts are answered from cache, only used with temperature 0
+MAX_LLM_RETRIES = 2 # Retries on transient LLM errors (timeouts, 5xx, rate limits) before the fallback response
+
+# One model client per event loop, its HTTP connection pool can't be shared across loops
+_model_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OpenAIChatCompletionClient] = weakref.WeakKeyDictionary()
+_prewarmed_clients: weakref.WeakSet[OpenAIChatCompletionClient] = weakref.WeakSet()
+
+# Sampling at temperature 0 is deterministic, so identical prompts can share a completion
+_response_cache = TTLCache(maxsize=10000, ttl=RESPONSE_CACHE_TTL) if MODEL_TEMPERATURE == 0 else None
 
 def setup_logging(log_level=logging.INFO):
     """
@@ -38,7 +59,11 @@ def setup_logging(log_level=logging.INFO):
 
 def create_model_client() -> OpenAIChatCompletionClient:
     """
-    Creates and configures the OpenAI chat completion client.
+    Creates and configures the OpenAI chat completion client. The client keeps the SDK's own
+    pooled HTTP transport, so concurrent scheduling jobs reuse keep-alive connections to the
+    LLM server, and only gets an explicit request timeout. The SDK's own retries are disabled:
+    the coordinator is the only retry layer (`MAX_LLM_RETRIES`) before its fallback response,
+    so a failing summary costs at most `MAX_LLM_RETRIES + 1` requests.
 
     Returns:
         OpenAIChatCompletionClient: Configured model client
@@ -47,6 +72,10 @@ def create_model_client() -> OpenAIChatCompletionClient:
         base_url=MODEL_BASE_URL,
         api_key=API_KEY,
         model=MODEL_NAME,
+        max_tokens=MODEL_MAX_TOKENS,
+        temperature=MODEL_TEMPERATURE,
+        timeout=HTTP_TIMEOUT,
+        max_retries=0,
         model_info={
             "vision": False,
             "function_calling": True,
@@ -57,6 +86,79 @@ def create_model_client() -> OpenAIChatCompletionClient:
     )
 
 
+def get_model_client() -> OpenAIChatCompletionClient:
+    """
+    Returns the model client bound to the running event loop, creating it on first use.
+    Reusing the client keeps its HTTP connection pool warm across scheduling runs instead
+    of paying the client construction and connection setup on every run.
+
+    Returns:
+        OpenAIChatCompletionClient: Cached model client for the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _model_clients.get(loop)
+
+    if client is None:
+        client = _model_clients[loop] = create_model_client()
+
+    return client
+
+
+async def close_model_client() -> None:
+    """
+    Closes and forgets the model client bound to the running event loop, if any.
+    """
+    client = _model_clients.pop(asyncio.get_running_loop(), None)
+
+    if client is not None:
+        await client.close()
+
+
+def event_loop_factory():
+    """
+    Returns the uvloop event loop factory when uvloop is installed, which speeds up the socket
+    handling of concurrent LLM requests. uvloop is optional and not available on Windows, the
+    stock asyncio loop is used otherwise.
+
+    Returns:
+        Callable or None: Event loop factory for asyncio.run, None for the default loop
+    """
+    if sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+async def prewarm(client: OpenAIChatCompletionClient) -> bool:
+    """
+    Sends a 1-token request so the LLM server loads the model before the first real request
+    needs it. Runs once per client, failures are ignored since the scheduling jobs will
+    surface them through their own retries and fallbacks.
+
+    Args:
+        client: Model client to warm up
+
+    Returns:
+        bool: Whether the model answered the ping
+    """
+    if client in _prewarmed_clients:
+        return True
+
+    try:
+        await client.create([UserMessage(content="ping", source="user")], extra_create_args={"max_tokens": 1})
+    except Exception:
+        return False
+
+    _prewarmed_clients.add(client)
+
+    return True
+
+
 async def messages_to_async_stream(messages):
     """
     Convert a list of messages to an async generator.
@@ -65,6 +167,144 @@ async def messages_to_async_stream(messages):
         yield message
 
 
+async def schedule_meeting(
+        participants: list[str],
+        schedule_date: str = SCHEDULE_DATE,
+        max_negotiation_rounds: int = MAX_NEGOTIATION_ROUNDS,
+        logger: Optional[AgentLogger] = None,
+        quiet: bool = False
+) -> TaskResult:
+    """
+    Runs a single scheduling job. Creates fresh agents and meeting schedule around the shared
+    model client, and logs the agent messages as each negotiation round produces them.
+    In quiet mode the messages are only collected into the returned result instead of being
+    logged, which keeps batch and benchmark runs free of output overhead. The loggers are shared
+    by every job of the process and are reused as they are, so concurrent jobs don't reconfigure
+    each other's logging.
+
+    Args:
+        participants: Participants that must attend the meeting
+        schedule_date: Day to schedule the meeting on, formatted as YYYY-MM-DD
+        max_negotiation_rounds: Maximum number of negotiation rounds
+        logger: Logger for the job progress and messages
+        quiet: Collect the agent messages silently instead of logging them
+
+    Returns:
+        TaskResult: Messages exchanged by the agents, ending with the coordinator's response
+    """
+    logger = logger or AgentLogger.get_or_create("SystemCoordinator")
+
+    initial_meeting_schedule = MeetingSchedule()
+    logger.info(f"Created initial meeting schedule: {initial_meeting_schedule}")
+
+    # Initialize model client and agents
+    logger.process_step("initialization", "Creating model client and agents")
+    client = get_model_client()
+
+    # Agent loggers, created once per process and shared by the following jobs
+    analyst_logger = AgentLogger.get_or_create("AnalystAgent")
+    negotiator_logger = AgentLogger.get_or_create("NegotiatorAgent")
+    coordinator_logger = AgentLogger.get_or_create("CoordinatorAgent")
+
+    analyst_agent = AnalystAgentAutogen(
+        name="analyst",
+        description="Proposes meeting slots that satisfy individual calendars.",
+        logger=analyst_logger,
+        max_concurrency=MAX_CONCURRENCY
+    )
+
+    negotiator_agent = NegotiatorAgentAutogen(
+        name="negotiator",
+        description="Negotiates preferences & selects best slot(s).",
+        logger=negotiator_logger
+    )
+
+    coordinator = CoordinatorAgent(
+        model_client=client,
+        analyst_agent=analyst_agent,
+        negotiator_agent=negotiator_agent,
+        max_negotiation_rounds=max_negotiation_rounds,
+        initial_meeting_schedule=initial_meeting_schedule,
+        logger=coordinator_logger,
+        max_llm_retries=MAX_LLM_RETRIES,
+        response_cache=_response_cache
+    )
+    logger.info("Agents initialized successfully")
+
+    # Process scheduling request
+    logger.process_step("schedule_request", "Processing scheduling request")
+    user_message = TextMessage(
+        source="user",
+        content=json.dumps({
+            "participants": participants,
+            'schedule_date': schedule_date,
+        }, separators=(",", ":"))
+    )
+    logger.data_in("User", "Received scheduling request", user_message.content)
+
+    logger.process_step("coordination", "Starting coordination process")
+
+    if not quiet:
+        logger.info(f"{'-' * 80}")
+        logger.info(f"Agent Messages")
+        logger.info(f"{'-' * 80}")
+
+    # Execute Coordinator, output messages as each negotiation round produces them
+    result = None
+
+    async for message in coordinator.run_stream(task=[user_message]):
+        if isinstance(message, TaskResult):
+            result = message
+            continue
+
+        if not quiet:
+            logger.info(f"{message.source}: {message.content}")
+
+    if not quiet:
+        logger.info(f"{'-' * 80}")
+
+    logger.process_step("coordination", "Coordination process completed")
+
+    return result
+
+
+async def schedule_meeting_batch(
+        specs: list[dict],
+        max_concurrency: int = BATCH_MAX_CONCURRENCY
+) -> list[tuple[Optional[TaskResult], float, Optional[Exception]]]:
+    """
+    Runs several scheduling jobs concurrently, at most `max_concurrency` at a time. All jobs
+    share the model client of the running event loop, and a failing job doesn't abort the others.
+    Jobs run in quiet mode unless their spec sets `quiet` explicitly.
+
+    Args:
+        specs: Keyword arguments for `schedule_meeting`, one dict per job
+        max_concurrency: Maximum number of jobs running at the same time
+
+    Returns:
+        list: One (result, elapsed seconds, error) tuple per job, in the order of `specs`
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Load the model once up front instead of inside the first jobs, when prewarming is enabled
+    if PREWARM_MODEL:
+        await prewarm(get_model_client())
+
+    async def _bounded(spec: dict) -> tuple[Optional[TaskResult], float, Optional[Exception]]:
+        async with semaphore:
+            started = time.perf_counter()
+
+            try:
+                result = await schedule_meeting(**{"quiet": True, **spec})
+
+                return result, time.perf_counter() - started, None
+
+            except Exception as e:
+                return None, time.perf_counter() - started, e
+
+    return list(await asyncio.gather(*[_bounded(spec) for spec in specs]))
+
+
 async def main() -> None:
     """
     Main function that orchestrates the meeting scheduling process.
@@ -73,79 +313,31 @@ async def main() -> None:
     # Initialize logging
     logger = setup_logging(logging.INFO)
     logger.info("Starting meeting scheduler application")
+    prewarm_task = None
 
     try:
-        # Initialize participants and schedule
-        participants = PARTICIPANTS
+        # Initialize participants and schedule, drawn per run once logging is set up
+        participants = PARTICIPANTS or get_random_participants(max_number=MAX_PARTICIPANTS)
         logger.info(f"Selected {len(participants)} random participants: {participants}")
 
-        initial_meeting_schedule = MeetingSchedule()
-        logger.info(f"Created initial meeting schedule: {initial_meeting_schedule}")
-
-        # Initialize model client and agents
-        logger.process_step("initialization", "Creating model client and agents")
-        client = create_model_client()
-
-        # Create agent loggers
-        analyst_logger = AgentLogger(agent_name="AnalystAgent", log_level=logging.INFO)
-        negotiator_logger = AgentLogger(agent_name="NegotiatorAgent", log_level=logging.INFO)
-        coordinator_logger = AgentLogger(agent_name="CoordinatorAgent", log_level=logging.INFO)
-
-        analyst_agent = AnalystAgentAutogen(
-            name="analyst",
-            description="Proposes meeting slots that satisfy individual calendars.",
-            logger=analyst_logger
-        )
-
-        negotiator_agent = NegotiatorAgentAutogen(
-            name="negotiator",
-            description="Negotiates preferences & selects best slot(s).",
-            logger=negotiator_logger
-        )
-
-        coordinator = CoordinatorAgent(
-            model_client=client,
-            analyst_agent=analyst_agent,
-            negotiator_agent=negotiator_agent,
-            max_negotiation_rounds=MAX_NEGOTIATION_ROUNDS,
-            initial_meeting_schedule=initial_meeting_schedule,
-            logger=coordinator_logger
-        )
-        logger.info("Agents initialized successfully")
-
-        # Process scheduling request
-        logger.process_step("schedule_request", "Processing scheduling request")
-        user_message = TextMessage(
-            source="user",
-            content=json.dumps({
-                "participants": participants,
-                'schedule_date': SCHEDULE_DATE,
-            })
-        )
-        logger.data_in("User", "Received scheduling request", user_message.content)
-
-        logger.process_step("coordination", "Starting coordination process")
-        # Execute Coordinator
-        result = await coordinator.run(task=[user_message])
-        logger.process_step("coordination", "Coordination process completed")
-
-        # Output messages
-        logger.info(f"{'-' * 80}")
-        logger.info(f"Agent Messages")
-        logger.info(f"{'-' * 80}")
+        if PREWARM_MODEL:
+            prewarm_task = asyncio.create_task(prewarm(get_model_client()))
+            logger.info("Prewarming model in the background")
 
-        for message in result.messages:
-            logger.info(f"{message.source}: {message.content}")
-
-        logger.info(f"{'-' * 80}")
+        await schedule_meeting(participants=participants, schedule_date=SCHEDULE_DATE, logger=logger)
 
         logger.info("Meeting scheduling completed successfully")
 
     except Exception as e:
         logger.error(f"Error during scheduling process: {str(e)}", exc_info=True)
-        print(f"Error during scheduling process: {str(e)}")
         raise
 
+    finally:
+        if prewarm_task is not None and not prewarm_task.done():
+            prewarm_task.cancel()
+
+        await close_model_client()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(), loop_factory=event_loop_factory())
\ No newline at end of file
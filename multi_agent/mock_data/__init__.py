@@ -0,0 +1,4 @@
+from pathlib import Path
+
+# Mock data files, at the root of the repository, resolved independently of the working directory
+DATA_DIR = Path(__file__).resolve().parents[2] / 'data'
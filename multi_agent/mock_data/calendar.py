@@ -1,8 +1,13 @@
+from functools import lru_cache
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
-__calendars = pd.read_csv('data/calendar_data.tsv', sep='\t')
+from multi_agent.mock_data import DATA_DIR
+
+# Datetime columns are parsed once at load, calendars are only read afterwards
+__calendars = pd.read_csv(DATA_DIR / 'calendar_data.tsv', sep='\t', parse_dates=['start_time', 'end_time'])
 
 
 def get_person_calendar(person_name: Union[int, str], start_date=None, end_date=None) -> pd.DataFrame:
@@ -30,31 +35,74 @@ def get_person_calendar(person_name: Union[int, str], start_date=None, end_date=
     :rtype: pd.DataFrame
     """
 
-    # Convert datetime columns if they're strings
-    if __calendars['start_time'].dtype == 'object':
-        __calendars['start_time'] = pd.to_datetime(__calendars['start_time'])
-        __calendars['end_time'] = pd.to_datetime(__calendars['end_time'])
+    # Pre-sorted calendar of the person, looked up instead of scanning the whole dataset
+    person_calendar = _calendars_by_person().get(_person_id(person_name))
+
+    # If person doesn't exist, return empty DataFrame with same structure
+    if person_calendar is None:
+        return pd.DataFrame(columns=__calendars.columns)
 
+    return _window(person_calendar, start_date, end_date)
+
+
+def get_person_calendars(person_names: list[Union[int, str]], start_date=None,
+                         end_date=None) -> dict[Union[int, str], pd.DataFrame]:
+    """
+    Retrieve the calendars of several persons at once, within an optional date range.
+
+    Each calendar is the same DataFrame `get_person_calendar` returns for that person.
+
+    :param person_names: The identifiers of the persons, with or without the "Person_" prefix.
+    :type person_names: list[Union[int, str]]
+    :param start_date: Optional start date for filtering events. Events starting on or
+        after this date will be included in the result. Defaults to None.
+    :type start_date: Union[datetime, str, None]
+    :param end_date: Optional end date for filtering events. Events starting on or
+        before this date will be included in the result. Defaults to None.
+    :type end_date: Union[datetime, str, None]
+    :return: The calendar of each requested person, keyed by the identifier given for it.
+    :rtype: dict[Union[int, str], pd.DataFrame]
+    """
+    return {person_name: get_person_calendar(person_name, start_date, end_date) for person_name in person_names}
+
+
+@lru_cache(maxsize=1)
+def _calendars_by_person() -> dict[str, pd.DataFrame]:
+    """
+    Calendar of every person, sorted by start time with a fresh index, split from the dataset
+    with a single `groupby` the first time a calendar is requested. The frames are shared and
+    never handed out as they are, `_window` always returns a new DataFrame.
+    """
+    return {
+        person: person_calendar.sort_values('start_time', kind='stable').reset_index(drop=True)
+        for person, person_calendar in __calendars.groupby('person', sort=False)
+    }
+
+
+def _person_id(person_name: Union[int, str]) -> str:
+    """Identifier of a person in the dataset, "Person_" prefixed."""
     if isinstance(person_name, int):
         person_name = str(person_name)
 
     if not person_name.startswith('Person_'):
         person_name = 'Person_' + person_name
 
-    # Filter by person
-    person_calendar = __calendars[__calendars['person'] == person_name].copy()
+    return person_name
 
-    # If person doesn't exist, return empty DataFrame with same structure
-    if person_calendar.empty:
-        return pd.DataFrame(columns=__calendars.columns)
 
-    # Apply date filters if provided
-    if start_date:
-        person_calendar = person_calendar[person_calendar['start_time'] >= pd.to_datetime(start_date)]
-    if end_date:
-        person_calendar = person_calendar[person_calendar['start_time'] <= pd.to_datetime(end_date)]
+def _window(person_calendar: pd.DataFrame, start_date, end_date) -> pd.DataFrame:
+    """Copy of the sorted calendar of a person restricted to the date range."""
+    if not start_date and not end_date:
+        return person_calendar.copy()
+
+    # Events are sorted by start time (missing ones last), so the events within the range are
+    # a contiguous block of the dated ones, found by binary search on the underlying array
+    start_times = person_calendar['start_time'].to_numpy()
+    start_times = start_times[:len(start_times) - np.isnat(start_times).sum()]
 
-    # Sort by start time
-    person_calendar = person_calendar.sort_values('start_time').reset_index(drop=True)
+    first = start_times.searchsorted(pd.Timestamp(start_date).to_datetime64(), side='left') \
+        if start_date else 0
+    last = start_times.searchsorted(pd.Timestamp(end_date).to_datetime64(), side='right') \
+        if end_date else len(start_times)
 
-    return person_calendar
+    return person_calendar.iloc[first:last].reset_index(drop=True)
@@ -1,11 +1,18 @@
 import random
+from functools import lru_cache
+from pathlib import Path
 
 import pandas as pd
+from pydantic import TypeAdapter
 
 from multi_agent.config.models import ParticipantPreferences
+from multi_agent.mock_data import DATA_DIR
 
+# Validates every row of the preferences file in a single pydantic-core call
+_preferences_adapter = TypeAdapter(list[ParticipantPreferences])
 
-def load_preferences(tsv_file: str) -> dict[str, ParticipantPreferences]:
+
+def load_preferences(tsv_file: str | Path) -> dict[str, ParticipantPreferences]:
     """
     Parses a TSV file to load participant preferences into a dictionary indexed by the
     participant's name. Each participant's preferences are modeled as a
@@ -18,32 +25,38 @@ def load_preferences(tsv_file: str) -> dict[str, ParticipantPreferences]:
         `ParticipantPreferences` instances with parsed preference data.
     :rtype: dict
     """
-    df = pd.read_csv(tsv_file, sep='\t')
-    preferences_dict = {}
-
-    for _, row in df.iterrows():
-        person = row['person']
-
-        # Convert pandas NaN to None and handle data types
-        prefs_data = {}
-        for col in df.columns:
-            if col == 'person':
-                continue
-
-            value = row[col]
-
-            # Convert pandas NaN to None
-            if pd.isna(value):
+    # Only the person and the preference fields are read, any other column is skipped by the parser
+    df = pd.read_csv(tsv_file, sep='\t',
+                     usecols=lambda col: col == 'person' or col in ParticipantPreferences.model_fields)
+    persons = []
+    records = []
+
+    # Plain tuples per row, no Series is built for each row or looked up per cell
+    for row in df.itertuples(index=False):
+        prefs_data = row._asdict()
+        persons.append(prefs_data.pop('person'))
+
+        # Convert pandas NaN to None (NaN is the only value not equal to itself)
+        for col, value in prefs_data.items():
+            if value != value:
                 prefs_data[col] = None
-            else:
-                prefs_data[col] = value
 
-        # Create Pydantic model instance
-        preferences_dict[person] = ParticipantPreferences(**prefs_data)
+        records.append(prefs_data)
+
+    # Create the Pydantic model instances all at once
+    preferences_dict = dict(zip(persons, _preferences_adapter.validate_python(records)))
 
     return preferences_dict
 
-__preferences = load_preferences(tsv_file='data/participant_preferences.tsv')
+@lru_cache(maxsize=1)
+def _all_preferences() -> dict[str, ParticipantPreferences]:
+    """Preferences of every participant, loaded from the mock data the first time they're needed."""
+    return load_preferences(tsv_file=DATA_DIR / 'participant_preferences.tsv')
+
+@lru_cache(maxsize=1)
+def _participants() -> tuple[str, ...]:
+    """Pool of participant names, in file order."""
+    return tuple(_all_preferences())
 
 def get_preference(name: str) -> ParticipantPreferences:
     """
@@ -59,17 +72,37 @@ def get_preference(name: str) -> ParticipantPreferences:
     :return: The preferences corresponding to the provided participant name.
     :rtype: ParticipantPreferences
     """
-    return __preferences[name]
+    return _all_preferences()[name]
 
 def get_random_participants(max_number: int = 3) -> list[str]:
     """
     Selects a random subset of participants from a list based on the maximum number allowed.
     The function generates a random number of participants between 2 and the specified maximum
-    number, and then selects that quantity randomly from the available participants.
+    number, and then selects that quantity randomly from the available participants. The
+    maximum is capped to the size of the participant pool, which is built once on first use.
 
-    :param max_number: Maximum number of participants that may be selected.
+    :param max_number: Maximum number of participants that may be selected, at least 2.
     :type max_number: int
     :return: A list of randomly selected participants' identifiers.
     :rtype: list[str]
     """
-    return random.sample(list(__preferences.keys()), random.randint(2, max_number))
+    if max_number < 2:
+        raise ValueError("max_number must be at least 2.")
+
+    participants = _participants()
+
+    return random.sample(participants, random.randint(2, min(max_number, len(participants))))
+
+def get_preferences(names: list[str]) -> dict[str, ParticipantPreferences]:
+    """
+    Retrieve the preferences of several participants at once.
+
+    :param names: The names of the participants whose preferences are being retrieved.
+    :type names: list[str]
+
+    :return: The preferences of each participant, keyed by name.
+    :rtype: dict[str, ParticipantPreferences]
+    """
+    preferences = _all_preferences()
+
+    return {name: preferences[name] for name in names}